@@ -2,20 +2,32 @@
 AKASHI MAM API - Dependencies
 """
 
-from typing import Annotated
+import hashlib
+import json
+import logging
+import time
+from collections.abc import AsyncGenerator
+from datetime import datetime
+from typing import Annotated, Any
 from uuid import UUID
 
+from cachetools import TLRUCache, TTLCache
 from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import bindparam, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.core.config import settings
 from app.core.database import get_db as _get_db
+from app.core.rate_limit import get_redis
 from app.core.security import decode_access_token
 from app.models import Tenant, User
 from app.schemas import PaginationParams
 
 
+logger = logging.getLogger(__name__)
+
 # Re-export get_db for convenience
 get_db = _get_db
 
@@ -28,16 +40,245 @@ security = HTTPBearer(auto_error=False)
 DbSession = Annotated[AsyncSession, Depends(_get_db)]
 
 
+async def get_db_rw(db: DbSession) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request session for write endpoints, committed before the response is sent.
+
+    Shares the request's `get_db` session (so auth lookups reuse it) but, used
+    with `scope="function"`, commits or rolls back as soon as the endpoint
+    returns instead of after the response has been streamed.
+    """
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
+# Write session: transaction ends before the response goes out
+DbSessionRW = Annotated[AsyncSession, Depends(get_db_rw, scope="function")]
+
+
+# =============================================================================
+# Auth Caches
+# =============================================================================
+
+# Upper bound for how long a decoded token is reused without re-verification
+JWT_CACHE_TTL_SECONDS = 30
+USER_CACHE_TTL_SECONDS = 60
+TENANT_CACHE_TTL_SECONDS = 300
+
+
+def _jwt_ttu(_key: str, payload: dict[str, Any], now: float) -> float:
+    """Expire a cached payload at its own `exp` claim, capped at the cache TTL."""
+    return min(now + JWT_CACHE_TTL_SECONDS, float(payload.get("exp", now)))
+
+
+# Decoded JWT payloads keyed by SHA-256 of the raw token (wall-clock timer to match `exp`)
+_jwt_cache: TLRUCache = TLRUCache(maxsize=10000, ttu=_jwt_ttu, timer=time.time)
+
+
+# -----------------------------------------------------------------------------
+# Shared second tier (Redis), used when settings.auth_cache_backend == "redis"
+# -----------------------------------------------------------------------------
+
+
+def _use_l2() -> bool:
+    """Whether the Redis tier is enabled."""
+    return settings.auth_cache_backend == "redis"
+
+
+async def _l2_get(key: str) -> Any | None:
+    """Read a JSON value from Redis; errors degrade to a miss."""
+    try:
+        raw = await (await get_redis()).get(key)
+    except Exception as e:
+        logger.warning(f"Auth cache read failed for {key}: {e}")
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+async def _l2_set(key: str, value: Any, ttl: int) -> None:
+    """Write a JSON value to Redis with a TTL; errors are logged and ignored."""
+    if ttl <= 0:
+        return
+    try:
+        await (await get_redis()).setex(key, ttl, json.dumps(value, default=str))
+    except Exception as e:
+        logger.warning(f"Auth cache write failed for {key}: {e}")
+
+
+async def _l2_delete(key: str) -> None:
+    """Remove a key from Redis; errors are logged and ignored."""
+    try:
+        await (await get_redis()).delete(key)
+    except Exception as e:
+        logger.warning(f"Auth cache delete failed for {key}: {e}")
+
+
+def _row_to_dict(obj: Any, exclude: frozenset[str] = frozenset()) -> dict[str, Any]:
+    """Column values of an ORM instance, minus `exclude`, for the Redis tier."""
+    return {
+        attr.key: getattr(obj, attr.key)
+        for attr in inspect(obj).mapper.column_attrs
+        if attr.key not in exclude
+    }
+
+
+def _row_from_dict(model: type, data: dict[str, Any]) -> Any:
+    """
+    Rebuild a detached ORM instance from `_row_to_dict` output.
+
+    Columns missing from `data` (excluded when cached) are left unloaded.
+    """
+    values = {}
+    for attr in inspect(model).column_attrs:
+        if attr.key not in data:
+            continue
+        value = data[attr.key]
+        if isinstance(value, str):
+            python_type = attr.columns[0].type.python_type
+            if python_type is UUID:
+                value = UUID(value)
+            elif python_type is datetime:
+                value = datetime.fromisoformat(value)
+        values[attr.key] = value
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    return obj
+
+
+async def _decode_cached(token: str) -> dict[str, Any] | None:
+    """
+    Decode an access token, reusing a previously verified payload when possible.
+
+    The `sub` claim is parsed once and stored as `_sub_uuid`. Invalid tokens
+    (including a missing or malformed `sub`) are never cached, so they are
+    re-checked on every request.
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = _jwt_cache.get(key)
+    if payload is not None:
+        return payload
+
+    l2_key = f"jwt:{key[:32]}"
+    payload = await _l2_get(l2_key) if _use_l2() else None
+    from_l2 = payload is not None
+    if not from_l2:
+        payload = decode_access_token(token)
+        if payload is None:
+            return None
+
+    try:
+        sub_uuid = UUID(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if _use_l2() and not from_l2:
+        ttl = min(JWT_CACHE_TTL_SECONDS, int(payload.get("exp", 0) - time.time()))
+        await _l2_set(l2_key, payload, ttl)
+
+    payload["_sub_uuid"] = sub_uuid
+    _jwt_cache[key] = payload
+    return payload
+
+
+# Fixed-shape lookups built once, so only bind values change between requests
+_user_by_id = select(User).where(User.id == bindparam("user_id"))
+_active_tenant_by_code = select(Tenant).where(
+    Tenant.code == bindparam("code"), Tenant.is_active == True
+)
+
+
+# Credentials are never written to Redis; read them from the database when needed
+_USER_L2_EXCLUDE = frozenset({"password_hash"})
+
+# Detached User rows keyed by id, re-attached to the request session on use
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=USER_CACHE_TTL_SECONDS)
+
+
+async def _get_user_cached(db: AsyncSession, user_id: UUID) -> User | None:
+    """
+    Load a user by ID, serving repeat lookups from the in-process cache.
+
+    The cached instance is never handed out directly; a session-bound copy
+    is returned so endpoint mutations are flushed by the request session.
+    """
+    user = _user_cache.get(user_id)
+    if user is None and _use_l2():
+        data = await _l2_get(f"user:{user_id}")
+        if data is not None:
+            user = _row_from_dict(User, data)
+            _user_cache[user_id] = user
+
+    if user is None:
+        result = await db.execute(_user_by_id, {"user_id": user_id})
+        user = result.scalar_one_or_none()
+        if user is None:
+            return None
+        db.expunge(user)
+        _user_cache[user_id] = user
+        if _use_l2():
+            await _l2_set(
+                f"user:{user_id}",
+                _row_to_dict(user, exclude=_USER_L2_EXCLUDE),
+                USER_CACHE_TTL_SECONDS,
+            )
+
+    return await db.merge(user, load=False)
+
+
+async def invalidate_user(user_id: UUID) -> None:
+    """
+    Drop a user from the auth cache (call after profile/password/status changes).
+
+    Call only once the change is committed; invalidating earlier lets a
+    concurrent request re-cache the old row for the rest of the TTL.
+    """
+    _user_cache.pop(user_id, None)
+    if _use_l2():
+        await _l2_delete(f"user:{user_id}")
+
+
+# Detached Tenant rows keyed by code; misses are remembered briefly so unknown
+# codes cannot be used to hammer the database
+_tenant_cache: TTLCache = TTLCache(maxsize=1024, ttl=TENANT_CACHE_TTL_SECONDS)
+_tenant_miss_cache: TTLCache = TTLCache(maxsize=1024, ttl=10)
+
+
+async def invalidate_tenant(code: str) -> None:
+    """Drop a tenant from the cache (call after tenant changes)."""
+    _tenant_cache.pop(code, None)
+    _tenant_miss_cache.pop(code, None)
+    if _use_l2():
+        await _l2_delete(f"tenant:{code}")
+
+
 async def get_tenant_by_code(
     db: DbSession,
     tenant_code: str | None = None,
 ) -> Tenant:
     """Get tenant by code, defaulting to 'dev' if not specified."""
     code = tenant_code or "dev"
-    result = await db.execute(
-        select(Tenant).where(Tenant.code == code, Tenant.is_active == True)
-    )
-    tenant = result.scalar_one_or_none()
+
+    tenant = _tenant_cache.get(code)
+    if tenant is None and code not in _tenant_miss_cache and _use_l2():
+        data = await _l2_get(f"tenant:{code}")
+        if data is not None:
+            tenant = _row_from_dict(Tenant, data)
+            _tenant_cache[code] = tenant
+
+    if tenant is None and code not in _tenant_miss_cache:
+        result = await db.execute(_active_tenant_by_code, {"code": code})
+        tenant = result.scalar_one_or_none()
+        if tenant is not None:
+            db.expunge(tenant)
+            _tenant_cache[code] = tenant
+            if _use_l2():
+                await _l2_set(f"tenant:{code}", _row_to_dict(tenant), TENANT_CACHE_TTL_SECONDS)
+        else:
+            _tenant_miss_cache[code] = True
 
     if not tenant:
         raise HTTPException(
@@ -45,7 +286,7 @@ async def get_tenant_by_code(
             detail=f"Tenant '{code}' not found or inactive",
         )
 
-    return tenant
+    return await db.merge(tenant, load=False)
 
 
 async def get_pagination(
@@ -70,9 +311,10 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
 ) -> User:
     """
-    Get the current authenticated user from JWT token.
+    Get the current authenticated, active user from JWT token.
 
-    Raises HTTPException 401 if token is invalid or user not found.
+    Raises HTTPException 401 if token is invalid or user not found,
+    and 403 if the user is inactive.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -83,44 +325,27 @@ async def get_current_user(
     if not credentials:
         raise credentials_exception
 
-    payload = decode_access_token(credentials.credentials)
+    payload = await _decode_cached(credentials.credentials)
     if payload is None:
         raise credentials_exception
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-
-    # Get user from database
-    result = await db.execute(
-        select(User).where(User.id == UUID(user_id))
-    )
-    user = result.scalar_one_or_none()
+    # Get user from cache or database
+    user = await _get_user_cached(db, payload["_sub_uuid"])
 
     if user is None:
         raise credentials_exception
 
-    return user
-
-
-async def get_current_active_user(
-    current_user: "User" = Depends(get_current_user),
-) -> User:
-    """
-    Get the current authenticated user, ensuring they are active.
-
-    Raises HTTPException 403 if user is inactive.
-    """
-    if not current_user.is_active:
+    if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user",
         )
-    return current_user
+
+    return user
 
 
-async def get_current_superuser(
-    current_user: User = Depends(get_current_active_user),
+async def require_superuser(
+    current_user: User = Depends(get_current_user),
 ) -> User:
     """
     Get the current user, ensuring they are a superuser.
@@ -147,24 +372,17 @@ async def get_optional_current_user(
     if not credentials:
         return None
 
-    payload = decode_access_token(credentials.credentials)
+    payload = await _decode_cached(credentials.credentials)
     if payload is None:
         return None
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        return None
-
-    result = await db.execute(
-        select(User).where(User.id == UUID(user_id))
-    )
-    return result.scalar_one_or_none()
+    return await _get_user_cached(db, payload["_sub_uuid"])
 
 
 # Type aliases for dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentActiveUser = Annotated[User, Depends(get_current_active_user)]
-CurrentSuperuser = Annotated[User, Depends(get_current_superuser)]
+CurrentActiveUser = CurrentUser
+CurrentSuperuser = Annotated[User, Depends(require_superuser)]
 OptionalUser = Annotated[User | None, Depends(get_optional_current_user)]
 
 
@@ -181,3 +399,18 @@ async def get_tenant_id(
 
 # Type alias for tenant ID
 TenantId = Annotated[UUID, Depends(get_tenant_id)]
+
+
+async def get_current_user_and_tenant(
+    current_user: User = Depends(get_current_user),
+) -> tuple[User, UUID]:
+    """
+    Get the current authenticated user together with their tenant ID.
+
+    Lets endpoints that need both take a single dependency.
+    """
+    return current_user, current_user.tenant_id
+
+
+# Type alias for (user, tenant_id)
+CurrentCtx = Annotated[tuple[User, UUID], Depends(get_current_user_and_tenant)]
@@ -1,29 +1,33 @@
 """
 AKASHI MAM API - Endpoints
+
+Endpoint modules are imported on first access (PEP 562), so importing one
+of them does not pull in the others.
 """
 
-from app.api.v1.endpoints import (
-    api_keys,
-    assets,
-    auth,
-    collections,
-    health,
-    jobs,
-    keywords,
-    markers,
-    search,
-    upload,
-)
+import importlib
+from types import ModuleType
 
 __all__ = [
     "api_keys",
     "assets",
     "auth",
     "collections",
+    "faces",
     "health",
     "jobs",
     "keywords",
     "markers",
+    "scenes",
     "search",
+    "transcriptions",
     "upload",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,17 +2,18 @@
 API Keys management endpoints.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db, get_tenant_id
+from app.api.deps import CurrentCtx, DbSessionRW, get_db
+from app.core.clock import utcnow
 from app.models.api_key import APIKey
-from app.models.user import User
 
 router = APIRouter()
 
@@ -22,11 +23,14 @@ router = APIRouter()
 # ===================
 
 
+Scope = Literal["read", "write", "admin"]
+
+
 class APIKeyCreate(BaseModel):
     """Schema for creating an API key."""
 
     name: str = Field(..., max_length=255)
-    scopes: list[str] = Field(default=["read"])
+    scopes: list[Scope] = Field(default=["read"])
     expires_in_days: int | None = Field(None, ge=1, le=365)
 
 
@@ -61,7 +65,7 @@ class APIKeyUpdate(BaseModel):
     """Schema for updating an API key."""
 
     name: str | None = Field(None, max_length=255)
-    scopes: list[str] | None = None
+    scopes: list[Scope] | None = None
     is_active: bool | None = None
 
 
@@ -72,15 +76,14 @@ class APIKeyUpdate(BaseModel):
 
 @router.get("/api-keys", response_model=list[APIKeyRead])
 async def list_api_keys(
+    ctx: CurrentCtx,
     db: AsyncSession = Depends(get_db),
-    tenant_id: UUID = Depends(get_tenant_id),
-    current_user: User = Depends(get_current_user),
 ):
     """List all API keys for the current user."""
+    current_user, tenant_id = ctx
     result = await db.execute(
         select(APIKey)
-        .where(APIKey.user_id == current_user.id)
-        .where(APIKey.tenant_id == tenant_id)
+        .where(APIKey.user_id == current_user.id, APIKey.tenant_id == tenant_id)
         .order_by(APIKey.created_at.desc())
     )
     return result.scalars().all()
@@ -89,9 +92,8 @@ async def list_api_keys(
 @router.post("/api-keys", response_model=APIKeyCreated, status_code=status.HTTP_201_CREATED)
 async def create_api_key(
     key_in: APIKeyCreate,
-    db: AsyncSession = Depends(get_db),
-    tenant_id: UUID = Depends(get_tenant_id),
-    current_user: User = Depends(get_current_user),
+    ctx: CurrentCtx,
+    db: DbSessionRW,
 ):
     """
     Create a new API key.
@@ -100,22 +102,15 @@ async def create_api_key(
     """
     from datetime import timedelta
 
+    current_user, tenant_id = ctx
+
     # Generate the key
     full_key, key_hash, key_prefix = APIKey.generate_key()
 
     # Calculate expiration
     expires_at = None
     if key_in.expires_in_days:
-        expires_at = datetime.now(timezone.utc) + timedelta(days=key_in.expires_in_days)
-
-    # Validate scopes
-    valid_scopes = {"read", "write", "admin"}
-    for scope in key_in.scopes:
-        if scope not in valid_scopes:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid scope: {scope}. Valid scopes: {valid_scopes}",
-            )
+        expires_at = utcnow() + timedelta(days=key_in.expires_in_days)
 
     # Create the key
     api_key = APIKey(
@@ -128,7 +123,7 @@ async def create_api_key(
         expires_at=expires_at,
     )
     db.add(api_key)
-    await db.commit()
+    await db.flush()
     await db.refresh(api_key)
 
     return APIKeyCreated(
@@ -145,16 +140,17 @@ async def create_api_key(
 @router.get("/api-keys/{key_id}", response_model=APIKeyRead)
 async def get_api_key(
     key_id: UUID,
+    ctx: CurrentCtx,
     db: AsyncSession = Depends(get_db),
-    tenant_id: UUID = Depends(get_tenant_id),
-    current_user: User = Depends(get_current_user),
 ):
     """Get an API key by ID."""
+    current_user, tenant_id = ctx
     result = await db.execute(
-        select(APIKey)
-        .where(APIKey.id == key_id)
-        .where(APIKey.user_id == current_user.id)
-        .where(APIKey.tenant_id == tenant_id)
+        select(APIKey).where(
+            APIKey.id == key_id,
+            APIKey.user_id == current_user.id,
+            APIKey.tenant_id == tenant_id,
+        )
     )
     api_key = result.scalar_one_or_none()
 
@@ -171,18 +167,24 @@ async def get_api_key(
 async def update_api_key(
     key_id: UUID,
     key_in: APIKeyUpdate,
-    db: AsyncSession = Depends(get_db),
-    tenant_id: UUID = Depends(get_tenant_id),
-    current_user: User = Depends(get_current_user),
+    ctx: CurrentCtx,
+    db: DbSessionRW,
 ):
     """Update an API key."""
-    result = await db.execute(
-        select(APIKey)
-        .where(APIKey.id == key_id)
-        .where(APIKey.user_id == current_user.id)
-        .where(APIKey.tenant_id == tenant_id)
+    current_user, tenant_id = ctx
+    owned = (
+        APIKey.id == key_id,
+        APIKey.user_id == current_user.id,
+        APIKey.tenant_id == tenant_id,
     )
-    api_key = result.scalar_one_or_none()
+
+    update_data = key_in.model_dump(exclude_unset=True)
+
+    if update_data:
+        stmt = update(APIKey).where(*owned).values(**update_data).returning(APIKey)
+    else:
+        stmt = select(APIKey).where(*owned)
+    api_key = (await db.execute(stmt)).scalar_one_or_none()
 
     if not api_key:
         raise HTTPException(
@@ -190,66 +192,51 @@ async def update_api_key(
             detail="API key not found",
         )
 
-    update_data = key_in.model_dump(exclude_unset=True)
-
-    # Validate scopes if provided
-    if "scopes" in update_data:
-        valid_scopes = {"read", "write", "admin"}
-        for scope in update_data["scopes"]:
-            if scope not in valid_scopes:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid scope: {scope}",
-                )
-
-    for field, value in update_data.items():
-        setattr(api_key, field, value)
-
-    await db.commit()
-    await db.refresh(api_key)
-
     return api_key
 
 
 @router.delete("/api-keys/{key_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_api_key(
     key_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    tenant_id: UUID = Depends(get_tenant_id),
-    current_user: User = Depends(get_current_user),
+    ctx: CurrentCtx,
+    db: DbSessionRW,
 ):
     """Delete an API key."""
+    current_user, tenant_id = ctx
     result = await db.execute(
-        select(APIKey)
-        .where(APIKey.id == key_id)
-        .where(APIKey.user_id == current_user.id)
-        .where(APIKey.tenant_id == tenant_id)
+        delete(APIKey)
+        .where(
+            APIKey.id == key_id,
+            APIKey.user_id == current_user.id,
+            APIKey.tenant_id == tenant_id,
+        )
+        .returning(APIKey.id)
     )
-    api_key = result.scalar_one_or_none()
 
-    if not api_key:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="API key not found",
         )
 
-    await db.delete(api_key)
-    await db.commit()
-
 
 @router.post("/api-keys/{key_id}/revoke", response_model=APIKeyRead)
 async def revoke_api_key(
     key_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    tenant_id: UUID = Depends(get_tenant_id),
-    current_user: User = Depends(get_current_user),
+    ctx: CurrentCtx,
+    db: DbSessionRW,
 ):
     """Revoke an API key (set inactive)."""
+    current_user, tenant_id = ctx
     result = await db.execute(
-        select(APIKey)
-        .where(APIKey.id == key_id)
-        .where(APIKey.user_id == current_user.id)
-        .where(APIKey.tenant_id == tenant_id)
+        update(APIKey)
+        .where(
+            APIKey.id == key_id,
+            APIKey.user_id == current_user.id,
+            APIKey.tenant_id == tenant_id,
+        )
+        .values(is_active=False)
+        .returning(APIKey)
     )
     api_key = result.scalar_one_or_none()
 
@@ -259,8 +246,4 @@ async def revoke_api_key(
             detail="API key not found",
         )
 
-    api_key.is_active = False
-    await db.commit()
-    await db.refresh(api_key)
-
     return api_key
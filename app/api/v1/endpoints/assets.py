@@ -2,16 +2,16 @@
 AKASHI MAM API - Assets Endpoints
 """
 
-from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
-from app.api.deps import DbSession, Pagination, get_tenant_by_code
+from app.api.deps import DbSession, DbSessionRW, Pagination, get_tenant_by_code
+from app.core.clock import utcnow
 from app.models import Asset, Tenant
 from app.models.asset_storage import AssetStorageLocation
 from app.schemas import (
@@ -30,6 +30,9 @@ storage_service = StorageService()
 
 router = APIRouter()
 
+# Base statement for list_assets; filters are appended per request
+_live_assets = select(Asset).where(Asset.deleted_at.is_(None))
+
 
 @router.get("", response_model=AssetListResponse)
 async def list_assets(
@@ -44,7 +47,7 @@ async def list_assets(
     List assets with pagination and filters.
     """
     # Build base query
-    query = select(Asset).where(Asset.deleted_at.is_(None))
+    query = _live_assets
 
     # Apply filters
     if tenant_code:
@@ -58,51 +61,65 @@ async def list_assets(
         query = query.where(Asset.status == status_filter)
 
     if search:
-        query = query.where(Asset.title.ilike(f"%{search}%"))
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
-    # Apply pagination and ordering
-    query = (
-        query.order_by(Asset.created_at.desc())
+        # Escape LIKE wildcards so the term is matched literally via the trigram index
+        term = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        query = query.where(Asset.title.ilike(f"%{term}%", escape="\\"))
+
+    # Page and total in one round trip (count is computed before LIMIT/OFFSET)
+    page_query = (
+        query.add_columns(func.count().over().label("_total"))
+        .order_by(Asset.created_at.desc())
         .offset(pagination.offset)
         .limit(pagination.page_size)
+        .options(
+            # Only accessible thumbnails are needed for the summary
+            selectinload(
+                Asset.storage_locations.and_(
+                    AssetStorageLocation.purpose == "thumbnail",
+                    AssetStorageLocation.is_accessible == True,
+                )
+            ),
+            # Skip the default selectin loads the summary never reads
+            lazyload(Asset.technical_metadata),
+            lazyload(Asset.keywords),
+            lazyload(Asset.markers),
+        )
     )
 
     # Execute query
-    result = await db.execute(query)
-    assets = result.scalars().all()
-
-    # Get asset IDs for thumbnail lookup
-    asset_ids = [asset.id for asset in assets]
-
-    # Fetch thumbnail storage locations
-    thumbnail_query = (
-        select(AssetStorageLocation)
-        .where(
-            AssetStorageLocation.asset_id.in_(asset_ids),
-            AssetStorageLocation.purpose == "thumbnail",
-            AssetStorageLocation.is_accessible == True,
-        )
-    )
-    thumbnail_result = await db.execute(thumbnail_query)
-    thumbnails = {loc.asset_id: loc for loc in thumbnail_result.scalars().all()}
+    rows = (await db.execute(page_query)).all()
+    assets = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0]._total
+    elif pagination.offset > 0:
+        # Past the last page: no rows to carry the window count
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await db.execute(count_query)).scalar() or 0
+    else:
+        total = 0
+
+    thumbnails = {
+        asset.id: asset.storage_locations[0]
+        for asset in assets
+        if asset.storage_locations
+    }
+
+    # Signing is local and CPU-only; repeat listings hit the presigned URL cache
+    thumbnail_urls = {}
+    for asset_id, thumb in thumbnails.items():
+        if thumb.bucket and thumb.path:
+            try:
+                thumbnail_urls[asset_id] = await storage_service.get_presigned_url(
+                    thumb.bucket, thumb.path, expires_in=3600
+                )
+            except Exception:
+                pass  # Skip if URL generation fails
 
     # Map to summary with thumbnail URLs
     items = []
     for asset in assets:
-        thumbnail_url = None
-        if asset.id in thumbnails:
-            thumb = thumbnails[asset.id]
-            if thumb.bucket and thumb.path:
-                try:
-                    thumbnail_url = await storage_service.get_presigned_url(
-                        thumb.bucket, thumb.path, expires_in=3600
-                    )
-                except Exception:
-                    pass  # Skip if URL generation fails
+        thumbnail_url = thumbnail_urls.get(asset.id)
 
         items.append(
             AssetSummary(
@@ -160,7 +177,7 @@ async def get_asset(
 @router.post("", response_model=AssetRead, status_code=status.HTTP_201_CREATED)
 async def create_asset(
     data: AssetCreate,
-    db: DbSession,
+    db: DbSessionRW,
 ):
     """
     Create a new asset (metadata only, without file).
@@ -198,7 +215,7 @@ async def create_asset(
 async def update_asset(
     asset_id: UUID,
     data: AssetUpdate,
-    db: DbSession,
+    db: DbSessionRW,
 ):
     """
     Update an existing asset.
@@ -219,8 +236,8 @@ async def update_asset(
     for field, value in update_data.items():
         setattr(asset, field, value)
 
+    # eager_defaults returns the server-side updated_at from the UPDATE itself
     await db.flush()
-    await db.refresh(asset)
 
     return asset
 
@@ -228,7 +245,7 @@ async def update_asset(
 @router.delete("/{asset_id}", response_model=MessageResponse)
 async def delete_asset(
     asset_id: UUID,
-    db: DbSession,
+    db: DbSessionRW,
     hard_delete: bool = Query(False, description="Permanently delete the asset"),
 ):
     """
@@ -254,7 +271,7 @@ async def delete_asset(
         message = f"Asset {asset_id} permanently deleted"
     else:
         # Soft delete
-        asset.deleted_at = datetime.utcnow()
+        asset.deleted_at = utcnow()
         asset.status = "deleted"
         message = f"Asset {asset_id} moved to trash"
 
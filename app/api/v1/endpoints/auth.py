@@ -4,25 +4,35 @@ AKASHI MAM API - Authentication Endpoints
 
 import logging
 from datetime import datetime, timezone
+from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.api.deps import (
     CurrentActiveUser,
     CurrentSuperuser,
     DbSession,
     get_tenant_by_code,
+    invalidate_user,
 )
 from app.core.config import settings
+from app.core.refresh_token_cache import (
+    cache_refresh_token,
+    get_cached_refresh_token,
+    invalidate_refresh_tokens,
+)
 from app.core.security import (
     create_access_token,
     create_token_pair,
+    find_refresh_token_match,
     get_password_hash,
     get_refresh_token_expiration,
     get_refresh_token_expiration_seconds,
     get_token_expiration_seconds,
     hash_refresh_token,
+    is_well_formed_refresh_token,
+    refresh_token_hash_prefix,
     verify_password,
 )
 from app.models import RefreshToken, User
@@ -80,10 +90,8 @@ async def login(
             detail="User account is inactive",
         )
 
-    # Update last login
+    # Update last login (written together with the refresh token on commit)
     user.last_login_at = datetime.now(timezone.utc)
-    await db.flush()
-    await db.refresh(user)
 
     # Create token pair
     token_data = create_token_pair(
@@ -96,12 +104,14 @@ async def login(
     refresh_token_record = RefreshToken(
         user_id=user.id,
         token_hash=token_data["refresh_token_hash"],
+        token_hash_prefix=refresh_token_hash_prefix(token_data["refresh_token_hash"]),
         expires_at=get_refresh_token_expiration(),
         ip_address=request.client.host if request.client else None,
         user_agent=request.headers.get("user-agent"),
     )
     db.add(refresh_token_record)
     await db.commit()
+    await invalidate_user(user.id)
 
     logger.info(f"User {user.email} logged in successfully")
 
@@ -126,32 +136,62 @@ async def refresh_tokens(
 
     - **refresh_token**: The refresh token from login
     """
+    invalid_token_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    # Reject malformed tokens before any cache/database lookup
+    if not is_well_formed_refresh_token(data.refresh_token):
+        raise invalid_token_exception
+
     # Hash the provided token
     token_hash = hash_refresh_token(data.refresh_token)
 
-    # Find the refresh token
-    result = await db.execute(
-        select(RefreshToken).where(
-            RefreshToken.token_hash == token_hash,
-            RefreshToken.is_revoked == False,
+    # Find the refresh token (cache first, then database)
+    cached = await get_cached_refresh_token(token_hash)
+    if cached is None:
+        result = await db.execute(
+            select(
+                RefreshToken.id,
+                RefreshToken.user_id,
+                RefreshToken.token_hash,
+                RefreshToken.expires_at,
+                RefreshToken.is_revoked,
+            ).where(RefreshToken.token_hash_prefix == refresh_token_hash_prefix(token_hash))
         )
-    )
-    refresh_token = result.scalar_one_or_none()
+        row = find_refresh_token_match(result.all(), token_hash)
+        if row:
+            cached = {
+                "id": row.id,
+                "user_id": row.user_id,
+                "expires_at": row.expires_at,
+                "is_revoked": row.is_revoked,
+            }
+            await cache_refresh_token(
+                token_hash,
+                token_id=row.id,
+                user_id=row.user_id,
+                expires_at=row.expires_at,
+                is_revoked=row.is_revoked,
+            )
 
-    if not refresh_token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired refresh token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    if not cached or cached["is_revoked"]:
+        raise invalid_token_exception
+
+    now = datetime.now(timezone.utc)
 
     # Check expiration
-    if datetime.now(timezone.utc) > refresh_token.expires_at:
+    if now > cached["expires_at"]:
         # Mark as revoked
-        refresh_token.is_revoked = True
-        refresh_token.revoked_at = datetime.now(timezone.utc)
-        refresh_token.revoked_reason = "expired"
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == cached["id"], RefreshToken.is_revoked == False)
+            .values(is_revoked=True, revoked_at=now, revoked_reason="expired")
+        )
         await db.commit()
+        await invalidate_refresh_tokens(token_hash)
 
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -160,16 +200,13 @@ async def refresh_tokens(
         )
 
     # Get user
-    user = await db.get(User, refresh_token.user_id)
+    user = await db.get(User, cached["user_id"])
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
         )
 
-    # Update last used
-    refresh_token.last_used_at = datetime.now(timezone.utc)
-
     # Create new token pair
     token_data = create_token_pair(
         user_id=str(user.id),
@@ -177,17 +214,29 @@ async def refresh_tokens(
         role=user.role,
     )
 
-    # Token rotation: revoke old token and create new one
+    # Update last used; with rotation, also revoke the old token.
+    # The database stays authoritative: a token revoked since it was cached
+    # matches no row here and is rejected.
+    values = {"last_used_at": now}
     if settings.jwt_refresh_token_rotate:
-        # Revoke old token
-        refresh_token.is_revoked = True
-        refresh_token.revoked_at = datetime.now(timezone.utc)
-        refresh_token.revoked_reason = "rotated"
+        values.update(is_revoked=True, revoked_at=now, revoked_reason="rotated")
 
-        # Create new refresh token
+    result = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == cached["id"], RefreshToken.is_revoked == False)
+        .values(**values)
+        .returning(RefreshToken.id)
+    )
+    if result.scalar_one_or_none() is None:
+        await invalidate_refresh_tokens(token_hash)
+        raise invalid_token_exception
+
+    # Token rotation: create new refresh token
+    if settings.jwt_refresh_token_rotate:
         new_refresh_token = RefreshToken(
             user_id=user.id,
             token_hash=token_data["refresh_token_hash"],
+            token_hash_prefix=refresh_token_hash_prefix(token_data["refresh_token_hash"]),
             expires_at=get_refresh_token_expiration(),
             ip_address=request.client.host if request.client else None,
             user_agent=request.headers.get("user-agent"),
@@ -196,6 +245,9 @@ async def refresh_tokens(
 
     await db.commit()
 
+    if settings.jwt_refresh_token_rotate:
+        await invalidate_refresh_tokens(token_hash)
+
     logger.info(f"Tokens refreshed for user {user.email}")
 
     return TokenPair(
@@ -218,23 +270,29 @@ async def logout(
 
     - **refresh_token**: The refresh token to revoke
     """
+    # A malformed token cannot match any session; nothing to revoke
+    if not is_well_formed_refresh_token(data.refresh_token):
+        logger.info(f"User {current_user.email} logged out")
+        return MessageResponse(message="Successfully logged out")
+
     # Hash the provided token
     token_hash = hash_refresh_token(data.refresh_token)
 
     # Find and revoke the refresh token
     result = await db.execute(
         select(RefreshToken).where(
-            RefreshToken.token_hash == token_hash,
+            RefreshToken.token_hash_prefix == refresh_token_hash_prefix(token_hash),
             RefreshToken.user_id == current_user.id,
         )
     )
-    refresh_token = result.scalar_one_or_none()
+    refresh_token = find_refresh_token_match(result.scalars().all(), token_hash)
 
     if refresh_token and not refresh_token.is_revoked:
         refresh_token.is_revoked = True
         refresh_token.revoked_at = datetime.now(timezone.utc)
         refresh_token.revoked_reason = "logout"
         await db.commit()
+        await invalidate_refresh_tokens(token_hash)
 
     logger.info(f"User {current_user.email} logged out")
     return MessageResponse(message="Successfully logged out")
@@ -248,23 +306,25 @@ async def logout_all_devices(
     """
     Logout from all devices by revoking all refresh tokens.
     """
-    # Find all active refresh tokens for user
+    # Revoke all active refresh tokens for user in one statement
     result = await db.execute(
-        select(RefreshToken).where(
+        update(RefreshToken)
+        .where(
             RefreshToken.user_id == current_user.id,
             RefreshToken.is_revoked == False,
         )
+        .values(
+            is_revoked=True,
+            revoked_at=datetime.now(timezone.utc),
+            revoked_reason="logout_all",
+        )
+        .returning(RefreshToken.token_hash)
     )
-    tokens = result.scalars().all()
-
-    revoked_count = 0
-    for token in tokens:
-        token.is_revoked = True
-        token.revoked_at = datetime.now(timezone.utc)
-        token.revoked_reason = "logout_all"
-        revoked_count += 1
+    revoked_hashes = result.scalars().all()
+    revoked_count = len(revoked_hashes)
 
     await db.commit()
+    await invalidate_refresh_tokens(*revoked_hashes)
 
     logger.info(f"User {current_user.email} logged out from all devices ({revoked_count} sessions)")
     return MessageResponse(message=f"Logged out from {revoked_count} devices")
@@ -293,13 +353,14 @@ async def update_current_user(
     # Only allow updating email and full_name
     if data.email is not None:
         # Check if email is taken by another user
-        existing = await db.execute(
-            select(User).where(
-                User.email == data.email,
-                User.id != current_user.id,
+        email_taken = await db.scalar(
+            select(
+                select(User.id)
+                .where(User.email == data.email, User.id != current_user.id)
+                .exists()
             )
         )
-        if existing.scalar_one_or_none():
+        if email_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
@@ -309,8 +370,8 @@ async def update_current_user(
     if data.full_name is not None:
         current_user.full_name = data.full_name
 
-    await db.flush()
-    await db.refresh(current_user)
+    await db.commit()
+    await invalidate_user(current_user.id)
 
     logger.info(f"User {current_user.email} updated their profile")
     return UserRead.model_validate(current_user)
@@ -325,7 +386,11 @@ async def change_password(
     """
     Change current user's password.
     """
-    if not verify_password(data.current_password, current_user.password_hash):
+    # Read the hash from the database; cached users do not carry credentials
+    password_hash = await db.scalar(
+        select(User.password_hash).where(User.id == current_user.id)
+    )
+    if not password_hash or not verify_password(data.current_password, password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
@@ -333,7 +398,8 @@ async def change_password(
 
     current_user.password_hash = get_password_hash(data.new_password)
     current_user.password_changed_at = datetime.now(timezone.utc)
-    await db.flush()
+    await db.commit()
+    await invalidate_user(current_user.id)
 
     logger.info(f"User {current_user.email} changed their password")
     return MessageResponse(message="Password changed successfully")
@@ -359,13 +425,14 @@ async def register_user(
     tenant = await get_tenant_by_code(db, data.tenant_code)
 
     # Check if email already exists for this tenant
-    existing = await db.execute(
-        select(User).where(
-            User.tenant_id == tenant.id,
-            User.email == data.email,
+    email_taken = await db.scalar(
+        select(
+            select(User.id)
+            .where(User.tenant_id == tenant.id, User.email == data.email)
+            .exists()
         )
     )
-    if existing.scalar_one_or_none():
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered for this tenant",
@@ -384,7 +451,6 @@ async def register_user(
 
     db.add(user)
     await db.flush()
-    await db.refresh(user)
 
     logger.info(f"New user registered: {user.email}")
     return UserRead.model_validate(user)
@@ -400,7 +466,8 @@ async def list_users(
     """
     List all users (superuser only).
     """
-    query = select(User)
+    # Plain column rows: no ORM instances or identity map for large listings
+    query = select(*(getattr(User, name) for name in UserRead.model_fields))
 
     if tenant_code:
         tenant = await get_tenant_by_code(db, tenant_code)
@@ -412,24 +479,21 @@ async def list_users(
     query = query.order_by(User.created_at.desc())
 
     result = await db.execute(query)
-    users = result.scalars().all()
 
-    return [UserRead.model_validate(u) for u in users]
+    return [UserRead.model_construct(**row) for row in result.mappings()]
 
 
 @router.get("/users/{user_id}", response_model=UserRead)
 async def get_user(
-    user_id: str,
+    user_id: UUID,
     db: DbSession,
     current_user: CurrentSuperuser,
 ):
     """
     Get user by ID (superuser only).
     """
-    from uuid import UUID
-
     result = await db.execute(
-        select(User).where(User.id == UUID(user_id))
+        select(User).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
 
@@ -444,7 +508,7 @@ async def get_user(
 
 @router.patch("/users/{user_id}", response_model=UserRead)
 async def update_user(
-    user_id: str,
+    user_id: UUID,
     data: UserUpdate,
     db: DbSession,
     current_user: CurrentSuperuser,
@@ -452,10 +516,8 @@ async def update_user(
     """
     Update user (superuser only).
     """
-    from uuid import UUID
-
     result = await db.execute(
-        select(User).where(User.id == UUID(user_id))
+        select(User).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
 
@@ -470,8 +532,8 @@ async def update_user(
     for field, value in update_data.items():
         setattr(user, field, value)
 
-    await db.flush()
-    await db.refresh(user)
+    await db.commit()
+    await invalidate_user(user.id)
 
     logger.info(f"User {user.email} updated by superuser")
     return UserRead.model_validate(user)
@@ -479,7 +541,7 @@ async def update_user(
 
 @router.delete("/users/{user_id}", response_model=MessageResponse)
 async def deactivate_user(
-    user_id: str,
+    user_id: UUID,
     db: DbSession,
     current_user: CurrentSuperuser,
 ):
@@ -487,10 +549,8 @@ async def deactivate_user(
     Deactivate a user (superuser only).
     Does not delete, just sets is_active to False.
     """
-    from uuid import UUID
-
     result = await db.execute(
-        select(User).where(User.id == UUID(user_id))
+        select(User).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
 
@@ -507,7 +567,8 @@ async def deactivate_user(
         )
 
     user.is_active = False
-    await db.flush()
+    await db.commit()
+    await invalidate_user(user.id)
 
     logger.info(f"User {user.email} deactivated by superuser")
     return MessageResponse(message="User deactivated", id=user.id)
@@ -6,7 +6,11 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import Integer, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, load_only, selectinload
 
 from app.api.deps import (
     CurrentActiveUser,
@@ -77,17 +81,26 @@ async def list_collections(
     if collection_type:
         query = query.where(Collection.collection_type == collection_type)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
-
-    # Paginate
+    # Page and total in one round trip (count is computed before LIMIT/OFFSET)
     offset = (pagination.page - 1) * pagination.page_size
-    query = query.order_by(Collection.updated_at.desc()).offset(offset).limit(pagination.page_size)
+    page_query = (
+        query.add_columns(func.count().over().label("_total"))
+        .order_by(Collection.updated_at.desc())
+        .offset(offset)
+        .limit(pagination.page_size)
+    )
+
+    rows = (await db.execute(page_query)).all()
+    collections = [row[0] for row in rows]
 
-    result = await db.execute(query)
-    collections = list(result.scalars().all())
+    if rows:
+        total = rows[0]._total
+    elif offset > 0:
+        # Past the last page: no rows to carry the window count
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await db.execute(count_query)).scalar() or 0
+    else:
+        total = 0
 
     return CollectionListResponse(
         items=[CollectionSummary.model_validate(c) for c in collections],
@@ -137,7 +150,6 @@ async def create_collection(
 
     db.add(collection)
     await db.flush()
-    await db.refresh(collection)
 
     logger.info(f"Collection '{collection.name}' created by user {current_user.id}")
     return CollectionRead.model_validate(collection)
@@ -152,8 +164,18 @@ async def get_collection(
     """
     Get a collection with its items.
     """
+    # Items (ordered by position) and their asset fields load in one extra query
     result = await db.execute(
-        select(Collection).where(Collection.id == collection_id)
+        select(Collection)
+        .where(Collection.id == collection_id)
+        .options(
+            selectinload(Collection.items)
+            .joinedload(CollectionItem.asset, innerjoin=True)
+            .options(
+                load_only(Asset.title, Asset.asset_type, Asset.duration_ms),
+                lazyload("*"),
+            )
+        )
     )
     collection = result.scalar_one_or_none()
 
@@ -165,36 +187,18 @@ async def get_collection(
         if not current_user or collection.created_by != current_user.id:
             raise HTTPException(status_code=403, detail="Access denied")
 
-    # Get items with asset info
-    items_query = (
-        select(
-            CollectionItem.id,
-            CollectionItem.asset_id,
-            CollectionItem.position,
-            CollectionItem.added_at,
-            CollectionItem.note,
-            Asset.title.label("asset_title"),
-            Asset.asset_type.label("asset_type"),
-            Asset.duration_ms.label("asset_duration_ms"),
-        )
-        .join(Asset, Asset.id == CollectionItem.asset_id)
-        .where(CollectionItem.collection_id == collection_id)
-        .order_by(CollectionItem.position)
-    )
-
-    items_result = await db.execute(items_query)
     items = [
         CollectionItemWithAsset(
-            id=row.id,
-            asset_id=row.asset_id,
-            position=row.position,
-            added_at=row.added_at,
-            note=row.note,
-            asset_title=row.asset_title,
-            asset_type=row.asset_type,
-            asset_duration_ms=row.asset_duration_ms,
+            id=item.id,
+            asset_id=item.asset_id,
+            position=item.position,
+            added_at=item.added_at,
+            note=item.note,
+            asset_title=item.asset.title,
+            asset_type=item.asset.asset_type,
+            asset_duration_ms=item.asset.duration_ms,
         )
-        for row in items_result.all()
+        for item in collection.items
     ]
 
     return CollectionWithItems(
@@ -235,7 +239,6 @@ async def update_collection(
 
     collection.updated_by = current_user.id
     await db.flush()
-    await db.refresh(collection)
 
     logger.info(f"Collection {collection_id} updated by user {current_user.id}")
     return CollectionRead.model_validate(collection)
@@ -277,6 +280,18 @@ async def delete_collection(
 # =============================================================================
 
 
+async def _bump_item_count(db: AsyncSession, collection_id: UUID, delta: int) -> None:
+    """Atomically adjust a collection's item_count (never below zero) in SQL."""
+    if delta == 0:
+        return
+    await db.execute(
+        update(Collection)
+        .where(Collection.id == collection_id)
+        .values(item_count=func.greatest(Collection.item_count + delta, 0))
+        .execution_options(synchronize_session=False)
+    )
+
+
 @router.post("/{collection_id}/items", response_model=CollectionItemRead, status_code=201)
 async def add_item_to_collection(
     collection_id: UUID,
@@ -287,15 +302,36 @@ async def add_item_to_collection(
     """
     Add an asset to a collection.
     """
-    # Get collection
+    # Get collection with asset/duplicate checks and next position in one query
+    asset_exists = select(Asset.id).where(Asset.id == data.asset_id).exists()
+    is_duplicate = (
+        select(CollectionItem.id)
+        .where(
+            CollectionItem.collection_id == collection_id,
+            CollectionItem.asset_id == data.asset_id,
+        )
+        .exists()
+    )
+    next_position = (
+        select(func.coalesce(func.max(CollectionItem.position), -1) + 1)
+        .where(CollectionItem.collection_id == collection_id)
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(Collection).where(Collection.id == collection_id)
+        select(
+            Collection,
+            asset_exists.label("asset_exists"),
+            is_duplicate.label("is_duplicate"),
+            next_position.label("next_position"),
+        ).where(Collection.id == collection_id)
     )
-    collection = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not collection:
+    if not row:
         raise HTTPException(status_code=404, detail="Collection not found")
 
+    collection = row.Collection
+
     # Check permission
     if collection.created_by != current_user.id and not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -304,29 +340,16 @@ async def add_item_to_collection(
         raise HTTPException(status_code=400, detail="Collection is locked")
 
     # Check if asset exists
-    asset_result = await db.execute(
-        select(Asset).where(Asset.id == data.asset_id)
-    )
-    if not asset_result.scalar_one_or_none():
+    if not row.asset_exists:
         raise HTTPException(status_code=404, detail="Asset not found")
 
     # Check for duplicate
-    existing = await db.execute(
-        select(CollectionItem).where(
-            CollectionItem.collection_id == collection_id,
-            CollectionItem.asset_id == data.asset_id,
-        )
-    )
-    if existing.scalar_one_or_none():
+    if row.is_duplicate:
         raise HTTPException(status_code=400, detail="Asset already in collection")
 
-    # Get next position if not specified
+    # Use next position if not specified
     if data.position is None:
-        max_pos_result = await db.execute(
-            select(func.coalesce(func.max(CollectionItem.position), -1))
-            .where(CollectionItem.collection_id == collection_id)
-        )
-        data.position = (max_pos_result.scalar() or -1) + 1
+        data.position = row.next_position
 
     item = CollectionItem(
         collection_id=collection_id,
@@ -340,10 +363,9 @@ async def add_item_to_collection(
     db.add(item)
 
     # Update item count
-    collection.item_count += 1
+    await _bump_item_count(db, collection_id, 1)
 
     await db.flush()
-    await db.refresh(item)
 
     logger.info(f"Asset {data.asset_id} added to collection {collection_id}")
     return CollectionItemRead.model_validate(item)
@@ -381,31 +403,30 @@ async def bulk_add_items(
     )
     position = (max_pos_result.scalar() or -1) + 1
 
+    # Insert in one statement; assets already in the collection hit the
+    # (collection_id, asset_id) unique constraint and are skipped atomically
+    asset_ids = list(dict.fromkeys(data.asset_ids))
     added_count = 0
-    for asset_id in data.asset_ids:
-        # Skip if already exists
-        existing = await db.execute(
-            select(CollectionItem).where(
-                CollectionItem.collection_id == collection_id,
-                CollectionItem.asset_id == asset_id,
-            )
+    if asset_ids:
+        result = await db.execute(
+            pg_insert(CollectionItem)
+            .values([
+                {
+                    "collection_id": collection_id,
+                    "asset_id": asset_id,
+                    "tenant_id": collection.tenant_id,
+                    "position": position + offset,
+                    "added_by": current_user.id,
+                }
+                for offset, asset_id in enumerate(asset_ids)
+            ])
+            .on_conflict_do_nothing(index_elements=["collection_id", "asset_id"])
+            .returning(CollectionItem.id)
         )
-        if existing.scalar_one_or_none():
-            continue
-
-        item = CollectionItem(
-            collection_id=collection_id,
-            asset_id=asset_id,
-            tenant_id=collection.tenant_id,
-            position=position,
-            added_by=current_user.id,
-        )
-        db.add(item)
-        position += 1
-        added_count += 1
+        added_count = len(result.scalars().all())
 
     # Update item count
-    collection.item_count += added_count
+    await _bump_item_count(db, collection_id, added_count)
     await db.flush()
 
     logger.info(f"Bulk added {added_count} assets to collection {collection_id}")
@@ -452,7 +473,7 @@ async def remove_item_from_collection(
     await db.delete(item)
 
     # Update item count
-    collection.item_count = max(0, collection.item_count - 1)
+    await _bump_item_count(db, collection_id, -1)
     await db.flush()
 
     logger.info(f"Asset {asset_id} removed from collection {collection_id}")
@@ -484,21 +505,23 @@ async def reorder_collection_items(
     if collection.is_locked:
         raise HTTPException(status_code=400, detail="Collection is locked")
 
-    # Update positions
-    for position, item_id in enumerate(data.item_ids):
+    # Update positions in one statement: UPDATE ... FROM (VALUES ...) AS v(id, pos)
+    if data.item_ids:
+        new_positions = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("pos", Integer),
+            name="v",
+        ).data([(item_id, position) for position, item_id in enumerate(data.item_ids)])
+
         await db.execute(
-            select(CollectionItem)
-            .where(CollectionItem.id == item_id)
-            .with_for_update()
-        )
-        item_result = await db.execute(
-            select(CollectionItem).where(CollectionItem.id == item_id)
+            update(CollectionItem)
+            .where(
+                CollectionItem.id == new_positions.c.id,
+                CollectionItem.collection_id == collection_id,
+            )
+            .values(position=new_positions.c.pos)
+            .execution_options(synchronize_session=False)
         )
-        item = item_result.scalar_one_or_none()
-        if item and item.collection_id == collection_id:
-            item.position = position
-
-    await db.flush()
 
     logger.info(f"Collection {collection_id} items reordered")
     return MessageResponse(message="Items reordered successfully")
@@ -2,17 +2,33 @@
 Face detection and person management API endpoints.
 """
 
+import asyncio
+from urllib.parse import urlencode
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, func, text
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import (
+    Float,
+    Integer,
+    String,
+    bindparam,
+    delete,
+    func,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.api.deps import get_current_user, get_db, get_tenant_id
 from app.models.asset import Asset
 from app.models.person import AssetFace, Person
 from app.models.user import User
 from app.schemas.person import (
+    BoundingBox,
     FaceCreate,
     FaceIdentifyRequest,
     FaceRead,
@@ -26,6 +42,105 @@ from app.schemas.person import (
 
 router = APIRouter()
 
+# search_by_face pulls limit * this many index candidates for exact reranking
+FACE_SEARCH_RERANK_FACTOR = 10
+
+# List endpoints read plain rows rather than ORM entities (no identity map,
+# instrumentation or relationship loading) and build the schemas directly
+_person_read_columns = (
+    Person.id,
+    Person.tenant_id,
+    Person.name,
+    Person.role,
+    Person.external_id,
+    Person.metadata_.label("metadata"),
+    Person.thumbnail_url,
+    Person.appearance_count,
+    Person.created_at,
+    Person.updated_at,
+)
+
+_face_read_select = select(
+    AssetFace.id,
+    AssetFace.asset_id,
+    AssetFace.tenant_id,
+    AssetFace.person_id,
+    AssetFace.timecode_ms,
+    AssetFace.duration_ms,
+    AssetFace.bbox_x,
+    AssetFace.bbox_y,
+    AssetFace.bbox_w,
+    AssetFace.bbox_h,
+    AssetFace.thumbnail_url,
+    AssetFace.confidence,
+    AssetFace.created_at,
+    Person.name.label("person_name"),
+    Person.role.label("person_role"),
+    Person.thumbnail_url.label("person_thumbnail_url"),
+).outerjoin(Person, Person.id == AssetFace.person_id)
+
+
+# search_by_face statements, built once. The query embedding stays untyped:
+# CAST(... AS halfvec) makes asyncpg encode it with pgvector's binary codec.
+_face_search_settings = text("""
+    SELECT
+        set_config('hnsw.ef_search', :ef_search, true),
+        set_config('hnsw.iterative_scan', 'strict_order', true)
+""").bindparams(bindparam("ef_search", type_=String()))
+
+_face_search_candidates = text("""
+    SELECT af.id, af.face_embedding
+    FROM asset_faces af
+    WHERE af.tenant_id = :tenant_id
+    AND af.face_embedding_half IS NOT NULL
+    AND af.face_embedding_half <#> CAST(:embedding AS halfvec) <= -:min_confidence
+    ORDER BY af.face_embedding_half <#> CAST(:embedding AS halfvec)
+    LIMIT :limit
+""").bindparams(
+    bindparam("tenant_id", type_=PG_UUID(as_uuid=True)),
+    bindparam("min_confidence", type_=Float()),
+    bindparam("limit", type_=Integer()),
+)
+
+_face_search_details = text("""
+    SELECT
+        af.id,
+        af.asset_id,
+        af.person_id,
+        af.timecode_ms,
+        af.thumbnail_url,
+        af.confidence,
+        af.created_at,
+        a.title as asset_title
+    FROM asset_faces af
+    JOIN assets a ON a.id = af.asset_id
+    WHERE af.id = ANY(:face_ids)
+""").bindparams(bindparam("face_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+
+def _face_read(row) -> FaceRead:
+    """Build a FaceRead from a `_face_read_select` row."""
+    return FaceRead(
+        id=row.id,
+        asset_id=row.asset_id,
+        tenant_id=row.tenant_id,
+        person_id=row.person_id,
+        timecode_ms=row.timecode_ms,
+        duration_ms=row.duration_ms,
+        bbox=BoundingBox(
+            x=row.bbox_x, y=row.bbox_y, w=row.bbox_w, h=row.bbox_h
+        ) if row.bbox_x is not None else None,
+        thumbnail_url=row.thumbnail_url,
+        confidence=row.confidence,
+        person=PersonSummary(
+            id=row.person_id,
+            name=row.person_name,
+            role=row.person_role,
+            thumbnail_url=row.person_thumbnail_url,
+        ) if row.person_name is not None else None,
+        created_at=row.created_at,
+    )
+
 
 # ======================
 # Persons CRUD
@@ -34,23 +149,52 @@ router = APIRouter()
 
 @router.get("/persons", response_model=list[PersonRead])
 async def list_persons(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
     search: str | None = None,
+    after_name: str | None = None,
+    after_id: UUID | None = None,
     db: AsyncSession = Depends(get_db),
     tenant_id: UUID = Depends(get_tenant_id),
     current_user: User = Depends(get_current_user),
 ):
-    """List all known persons."""
-    query = select(Person).where(Person.tenant_id == tenant_id)
+    """
+    List all known persons.
+
+    For deep pages pass the name and id of the last person received as
+    `after_name`/`after_id` (keyset pagination) instead of `skip`. A full
+    page carries an `X-Next-Cursor` header holding those two query
+    parameters for the next request.
+    """
+    if (after_name is None) != (after_id is None):
+        raise HTTPException(
+            status_code=422,
+            detail="after_name and after_id must be given together",
+        )
+
+    query = select(*_person_read_columns).where(Person.tenant_id == tenant_id)
 
     if search:
         query = query.where(Person.name.ilike(f"%{search}%"))
 
-    query = query.order_by(Person.name).offset(skip).limit(limit)
+    if after_id is not None:
+        query = query.where(tuple_(Person.name, Person.id) > (after_name, after_id))
+    else:
+        query = query.offset(skip)
+
+    query = query.order_by(Person.name, Person.id).limit(limit)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    persons = [PersonRead.model_validate(row) for row in result.mappings()]
+
+    if persons and len(persons) == limit:
+        last = persons[-1]
+        response.headers["X-Next-Cursor"] = urlencode(
+            {"after_name": last.name, "after_id": str(last.id)}
+        )
+
+    return persons
 
 
 @router.post("/persons", response_model=PersonRead, status_code=status.HTTP_201_CREATED)
@@ -107,11 +251,24 @@ async def update_person(
     current_user: User = Depends(get_current_user),
 ):
     """Update a person."""
-    result = await db.execute(
-        select(Person)
-        .where(Person.id == person_id)
-        .where(Person.tenant_id == tenant_id)
-    )
+    update_data = {
+        ("metadata_" if field == "metadata" else field): value
+        for field, value in person_in.model_dump(exclude_unset=True).items()
+    }
+
+    # Update and fetch in one statement; no row means missing or other tenant
+    if update_data:
+        query = (
+            update(Person)
+            .where(Person.id == person_id, Person.tenant_id == tenant_id)
+            .values(**update_data)
+            .returning(Person)
+        )
+    else:
+        query = select(Person).where(
+            Person.id == person_id, Person.tenant_id == tenant_id
+        )
+    result = await db.execute(query.options(lazyload(Person.faces)))
     person = result.scalar_one_or_none()
 
     if not person:
@@ -120,15 +277,7 @@ async def update_person(
             detail="Person not found",
         )
 
-    update_data = person_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        if field == "metadata":
-            setattr(person, "metadata_", value)
-        else:
-            setattr(person, field, value)
-
     await db.commit()
-    await db.refresh(person)
     return person
 
 
@@ -140,20 +289,19 @@ async def delete_person(
     current_user: User = Depends(get_current_user),
 ):
     """Delete a person."""
+    # Faces referencing the person are unlinked by ON DELETE SET NULL
     result = await db.execute(
-        select(Person)
-        .where(Person.id == person_id)
-        .where(Person.tenant_id == tenant_id)
+        delete(Person)
+        .where(Person.id == person_id, Person.tenant_id == tenant_id)
+        .returning(Person.id)
     )
-    person = result.scalar_one_or_none()
 
-    if not person:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Person not found",
         )
 
-    await db.delete(person)
     await db.commit()
 
 
@@ -168,14 +316,14 @@ async def get_person_appearances(
 ):
     """Get all appearances of a person across assets."""
     result = await db.execute(
-        select(AssetFace)
+        _face_read_select
         .where(AssetFace.person_id == person_id)
         .where(AssetFace.tenant_id == tenant_id)
         .order_by(AssetFace.created_at.desc())
         .offset(skip)
         .limit(limit)
     )
-    return result.scalars().all()
+    return [_face_read(row) for row in result]
 
 
 # ======================
@@ -193,7 +341,7 @@ async def list_asset_faces(
 ):
     """List all detected faces in an asset."""
     query = (
-        select(AssetFace)
+        _face_read_select
         .where(AssetFace.asset_id == asset_id)
         .where(AssetFace.tenant_id == tenant_id)
     )
@@ -204,7 +352,7 @@ async def list_asset_faces(
     query = query.order_by(AssetFace.timecode_ms)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    return [_face_read(row) for row in result]
 
 
 @router.post("/assets/{asset_id}/detect-faces")
@@ -218,13 +366,16 @@ async def start_face_detection(
     """Start face detection for an asset."""
     from app.models.asset_storage import IngestJob
 
-    # Verify asset exists
-    result = await db.execute(
-        select(Asset).where(Asset.id == asset_id)
+    # Verify asset exists in this tenant
+    asset_exists = await db.scalar(
+        select(
+            select(Asset.id)
+            .where(Asset.id == asset_id, Asset.tenant_id == tenant_id)
+            .exists()
+        )
     )
-    asset = result.scalar_one_or_none()
 
-    if not asset:
+    if not asset_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset not found",
@@ -240,10 +391,9 @@ async def start_face_detection(
         config={"sample_interval": sample_interval},
     )
     db.add(job)
-    await db.flush()
     await db.commit()
 
-    # Queue task
+    # Queue task (only once the job row is committed)
     from app.workers.tasks.face_detection import detect_faces
 
     detect_faces.delay(
@@ -269,40 +419,47 @@ async def identify_face(
     current_user: User = Depends(get_current_user),
 ):
     """Manually identify a face as a known person."""
-    from sqlalchemy import update
-
-    # Verify face exists
+    # Link the face and bump the person's count in one statement; the face is
+    # only updated when the person exists in the same tenant
     result = await db.execute(
-        select(AssetFace)
-        .where(AssetFace.id == face_id)
-        .where(AssetFace.tenant_id == tenant_id)
+        text("""
+            WITH p AS (
+                SELECT id FROM persons
+                WHERE id = :person_id AND tenant_id = :tenant_id
+            ),
+            f AS (
+                UPDATE asset_faces SET person_id = :person_id
+                WHERE id = :face_id AND tenant_id = :tenant_id
+                AND EXISTS (SELECT 1 FROM p)
+                RETURNING id
+            )
+            UPDATE persons
+            SET appearance_count = appearance_count + 1, updated_at = NOW()
+            WHERE id = :person_id AND EXISTS (SELECT 1 FROM f)
+            RETURNING name
+        """),
+        {
+            "face_id": face_id,
+            "person_id": request.person_id,
+            "tenant_id": tenant_id,
+        },
     )
-    face = result.scalar_one_or_none()
-
-    if not face:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Face not found",
+    person_name = result.scalar_one_or_none()
+
+    if person_name is None:
+        # Nothing was updated: report which of the two is missing
+        face_exists = await db.scalar(
+            select(
+                select(AssetFace.id)
+                .where(AssetFace.id == face_id, AssetFace.tenant_id == tenant_id)
+                .exists()
+            )
         )
-
-    # Verify person exists
-    result = await db.execute(
-        select(Person)
-        .where(Person.id == request.person_id)
-        .where(Person.tenant_id == tenant_id)
-    )
-    person = result.scalar_one_or_none()
-
-    if not person:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Person not found",
+            detail="Person not found" if face_exists else "Face not found",
         )
 
-    # Update face
-    face.person_id = request.person_id
-    person.appearance_count += 1
-
     await db.commit()
 
     # Trigger embedding update for person
@@ -312,7 +469,7 @@ async def identify_face(
     return {
         "face_id": str(face_id),
         "person_id": str(request.person_id),
-        "person_name": person.name,
+        "person_name": person_name,
         "message": "Face identified",
     }
 
@@ -327,63 +484,92 @@ async def search_by_face(
     """Search for similar faces using an image."""
     from app.services.face_service import face_service
 
-    # Get embedding from uploaded image
-    import asyncio
-    loop = asyncio.get_event_loop()
+    # Extract the embedding while the session checks out a connection and
+    # applies the HNSW settings; neither depends on the other
+    embedding_task = asyncio.create_task(
+        face_service.get_embedding_from_image(request.image_base64)
+    )
+
+    # Fetch a wider candidate set from the index and rerank it exactly
+    candidate_limit = request.limit * FACE_SEARCH_RERANK_FACTOR
+
+    # Let the HNSW index explore enough candidates for the candidate limit,
+    # and keep scanning (pgvector >= 0.8) while the tenant/similarity filters
+    # discard candidates; set_config(..., true) is transaction-local like SET LOCAL
     try:
-        embedding = await face_service.get_embedding_from_image(request.image_base64)
+        await db.execute(
+            _face_search_settings,
+            {"ef_search": str(max(candidate_limit, 40))},
+        )
+    except BaseException:
+        embedding_task.cancel()
+        raise
+
+    try:
+        embedding = await embedding_task
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
-    # Search for similar faces using pgvector
-    result = await db.execute(
-        text("""
-            SELECT
-                af.id,
-                af.asset_id,
-                af.person_id,
-                af.timecode_ms,
-                af.thumbnail_url,
-                af.confidence,
-                1 - (af.face_embedding <=> :embedding::vector) as similarity,
-                a.title as asset_title
-            FROM asset_faces af
-            JOIN assets a ON a.id = af.asset_id
-            WHERE af.tenant_id = :tenant_id
-            AND af.face_embedding IS NOT NULL
-            ORDER BY af.face_embedding <=> :embedding::vector
-            LIMIT :limit
-        """),
+    # Stage 1: approximate candidates from the HNSW index on the FP16 copy
+    # (face_embedding_half). Embeddings are unit-length, so negative inner
+    # product (<#>) ranks the same as cosine distance and its negation is the
+    # cosine similarity.
+    candidates = (await db.execute(
+        _face_search_candidates,
         {
             "tenant_id": tenant_id,
-            "embedding": str(embedding),
-            "limit": request.limit,
+            "embedding": embedding,
+            "min_confidence": request.min_confidence,
+            "limit": candidate_limit,
         }
+    )).all()
+
+    if not candidates:
+        return []
+
+    # Stage 2: exact rerank on the full-precision vectors in one matrix-vector
+    # product, keeping the best `limit` above the threshold
+    import numpy as np
+
+    vectors = np.stack([row.face_embedding.to_numpy() for row in candidates])
+    scores = vectors @ np.asarray(embedding, dtype=np.float32)
+    top = np.flatnonzero(scores >= request.min_confidence)
+    if len(top) > request.limit:
+        top = top[np.argpartition(-scores[top], request.limit)[:request.limit]]
+    top = top[np.argsort(-scores[top])]
+    similarity = {candidates[i].id: float(scores[i]) for i in top}
+
+    if not similarity:
+        return []
+
+    # Stage 3: display fields for the final faces only
+    result = await db.execute(
+        _face_search_details, {"face_ids": list(similarity)}
     )
+    rows = {row.id: row for row in result}
 
-    results = []
-    for row in result.fetchall():
-        if row.similarity >= request.min_confidence:
-            results.append(FaceSearchResult(
-                face=FaceRead(
-                    id=row.id,
-                    asset_id=row.asset_id,
-                    tenant_id=tenant_id,
-                    person_id=row.person_id,
-                    timecode_ms=row.timecode_ms,
-                    duration_ms=None,
-                    bbox=None,
-                    thumbnail_url=row.thumbnail_url,
-                    confidence=row.confidence,
-                    person=None,
-                    created_at=None,
-                ),
-                similarity=row.similarity,
+    return [
+        FaceSearchResult(
+            face=FaceRead(
+                id=row.id,
                 asset_id=row.asset_id,
-                asset_title=row.asset_title,
-            ))
-
-    return results
+                tenant_id=tenant_id,
+                person_id=row.person_id,
+                timecode_ms=row.timecode_ms,
+                duration_ms=None,
+                bbox=None,
+                thumbnail_url=row.thumbnail_url,
+                confidence=row.confidence,
+                person=None,
+                created_at=row.created_at,
+            ),
+            similarity=score,
+            asset_id=row.asset_id,
+            asset_title=row.asset_title,
+        )
+        for face_id, score in similarity.items()
+        if (row := rows.get(face_id)) is not None
+    ]
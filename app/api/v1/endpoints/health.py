@@ -2,29 +2,56 @@
 AKASHI MAM API - Health Check Endpoints
 """
 
-from fastapi import APIRouter, Depends
+import asyncio
+import time
+
+from fastapi import APIRouter
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import engine
 from app.schemas import HealthResponse
 
 
 router = APIRouter()
 
+# Probe bursts within this window share one database check
+DB_CHECK_TTL_SECONDS = 0.5
+
+_db_check_lock = asyncio.Lock()
+_db_checked_at: float = float("-inf")
+_db_error: str | None = None
+
+
+async def _check_database() -> str | None:
+    """Run `SELECT 1` at most once per TTL; returns the error message, if any."""
+    global _db_checked_at, _db_error
+
+    if time.monotonic() - _db_checked_at < DB_CHECK_TTL_SECONDS:
+        return _db_error
+
+    async with _db_check_lock:
+        # Another probe may have refreshed the result while we waited
+        if time.monotonic() - _db_checked_at < DB_CHECK_TTL_SECONDS:
+            return _db_error
+
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            _db_error = None
+        except Exception as e:
+            _db_error = str(e)
+        _db_checked_at = time.monotonic()
+        return _db_error
+
 
 @router.get("", response_model=HealthResponse)
-async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
+async def health_check() -> HealthResponse:
     """
     Health check endpoint.
     Verifies database connectivity.
     """
     # Check database
-    db_status = "ok"
-    try:
-        await db.execute(text("SELECT 1"))
-    except Exception:
-        db_status = "error"
+    db_status = "ok" if await _check_database() is None else "error"
 
     # TODO: Check MinIO connectivity
     storage_status = "ok"
@@ -38,16 +65,15 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
 
 
 @router.get("/ready")
-async def readiness_check(db: AsyncSession = Depends(get_db)):
+async def readiness_check():
     """
     Readiness check for Kubernetes.
     Returns 200 only if the service is ready to accept traffic.
     """
-    try:
-        await db.execute(text("SELECT 1"))
+    error = await _check_database()
+    if error is None:
         return {"status": "ready"}
-    except Exception as e:
-        return {"status": "not ready", "error": str(e)}
+    return {"status": "not ready", "error": error}
 
 
 @router.get("/live")
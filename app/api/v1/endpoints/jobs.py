@@ -5,11 +5,15 @@ Endpoints for monitoring and manually triggering processing jobs.
 
 import asyncio
 import logging
+import subprocess
+import tempfile
+import time
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.api.deps import DbSession
 from app.models import Asset, AssetStorageLocation, AssetTechnicalMetadata, IngestJob
@@ -17,8 +21,127 @@ from app.schemas import JobSummary, MessageResponse
 
 logger = logging.getLogger(__name__)
 
+# Celery task per job type, resolved once at import time
+try:
+    from celery import group
+
+    from app.workers.celery_app import celery_app
+    from app.workers.tasks.metadata import extract_metadata
+    from app.workers.tasks.proxy import generate_proxy
+    from app.workers.tasks.thumbnail import generate_thumbnail
+
+    _TASK_DISPATCH = {
+        "metadata": extract_metadata,
+        "proxy": generate_proxy,
+        "thumbnail": generate_thumbnail,
+    }
+    _task_import_error: ImportError | None = None
+except ImportError as e:
+    _TASK_DISPATCH = {}
+    _task_import_error = e
+    logger.warning(f"Celery tasks unavailable, only sync job processing will work: {e}")
+
+
+def _dispatch_job(job) -> None:
+    """Queue a job (an IngestJob or a row with the same columns) on its Celery task."""
+    if _task_import_error is not None:
+        raise _task_import_error
+    task = _TASK_DISPATCH.get(job.job_type)
+    if task:
+        task.delay(str(job.id), str(job.asset_id), job.input_path)
+
+
+def _dispatch_jobs(jobs: list[IngestJob]) -> None:
+    """Queue several jobs as one group, publishing over a single broker connection."""
+    if _task_import_error is not None:
+        raise _task_import_error
+    signatures = [
+        _TASK_DISPATCH[job.job_type].s(str(job.id), str(job.asset_id), job.input_path)
+        for job in jobs
+        if job.job_type in _TASK_DISPATCH
+    ]
+    if not signatures:
+        return
+    with celery_app.producer_or_acquire() as producer:
+        group(signatures).apply_async(producer=producer)
+
+
+# Skip a Celery dispatch poll once active tasks reach this share of the
+# workers' total concurrency; the jobs stay pending for a later poll
+WORKER_SATURATION_RATIO = 1.0
+WORKER_INSPECT_TIMEOUT_SECONDS = 0.2
+# How long a saturation verdict and the worker pool size are reused
+WORKER_SATURATION_TTL_SECONDS = 1.0
+WORKER_STATS_TTL_SECONDS = 60.0
+
+# (worker count, total pool concurrency) from worker stats, and when to re-read it
+_worker_pool: tuple[int, int] = (0, 0)
+_worker_pool_expires = 0.0
+_saturated = False
+_saturated_expires = 0.0
+
+
+def _worker_pool_size(now: float) -> tuple[int, int]:
+    """Worker count and total pool concurrency, re-read from stats once the TTL lapses."""
+    global _worker_pool, _worker_pool_expires
+    if now >= _worker_pool_expires:
+        stats = celery_app.control.inspect(timeout=WORKER_INSPECT_TIMEOUT_SECONDS).stats() or {}
+        _worker_pool = (
+            len(stats),
+            sum(worker.get("pool", {}).get("max-concurrency", 0) for worker in stats.values()),
+        )
+        _worker_pool_expires = now + WORKER_STATS_TTL_SECONDS
+    return _worker_pool
+
+
+def _workers_saturated() -> bool:
+    """Whether the Celery workers already run as many tasks as they can (blocking)."""
+    global _saturated, _saturated_expires
+    if _task_import_error is not None:
+        return False
+
+    now = time.monotonic()
+    if now < _saturated_expires:
+        return _saturated
+
+    workers, concurrency = _worker_pool_size(now)
+    if not concurrency:
+        # No workers answered - let the dispatch queue the jobs as before
+        saturated = False
+    else:
+        # One broadcast that returns as soon as every known worker has replied
+        active = celery_app.control.inspect(
+            timeout=WORKER_INSPECT_TIMEOUT_SECONDS, limit=workers
+        ).active() or {}
+        saturated = sum(len(tasks) for tasks in active.values()) >= (
+            WORKER_SATURATION_RATIO * concurrency
+        )
+
+    _saturated, _saturated_expires = saturated, now + WORKER_SATURATION_TTL_SECONDS
+    return saturated
+
+
 router = APIRouter()
 
+# IngestJob columns backing JobSummary, in schema field order
+_job_summary_columns = [getattr(IngestJob, name) for name in JobSummary.model_fields]
+
+# Poll interval hinted to process-pending callers, in milliseconds. It doubles
+# after an empty poll and halves after a full batch, within these bounds.
+PENDING_POLL_MIN_MS = 50
+PENDING_POLL_MAX_MS = 5000
+_pending_poll_ms = 1000
+
+
+def _next_pending_poll_ms(found: int, limit: int) -> int:
+    """Adapt the suggested process-pending poll interval to the last batch size."""
+    global _pending_poll_ms
+    if found == 0:
+        _pending_poll_ms = min(_pending_poll_ms * 2, PENDING_POLL_MAX_MS)
+    elif found >= limit:
+        _pending_poll_ms = max(_pending_poll_ms // 2, PENDING_POLL_MIN_MS)
+    return _pending_poll_ms
+
 
 @router.get("", response_model=list[JobSummary])
 async def list_jobs(
@@ -29,7 +152,8 @@ async def list_jobs(
     limit: int = Query(50, le=100),
 ):
     """List processing jobs with filters."""
-    query = select(IngestJob).order_by(IngestJob.created_at.desc())
+    # Only the summary columns - skip the JSONB result and other wide fields
+    query = select(*_job_summary_columns).order_by(IngestJob.created_at.desc())
 
     if status_filter:
         query = query.where(IngestJob.status == status_filter)
@@ -40,31 +164,34 @@ async def list_jobs(
 
     query = query.limit(limit)
     result = await db.execute(query)
-    jobs = result.scalars().all()
-
-    return [
-        JobSummary(
-            id=job.id,
-            job_type=job.job_type,
-            status=job.status,
-            progress=job.progress,
-            created_at=job.created_at,
-            error_message=job.error_message,
-        )
-        for job in jobs
-    ]
+
+    return [JobSummary.model_construct(**row) for row in result.mappings()]
 
 
 @router.post("/process-pending", response_model=MessageResponse)
 async def process_pending_jobs(
     db: DbSession,
+    response: Response,
     limit: int = Query(10, le=50),
     sync: bool = Query(False, description="Process synchronously (blocking)"),
 ):
     """
     Process pending jobs.
     Use sync=true to process synchronously (useful when Celery is not running).
+
+    The X-Next-Poll-Ms header suggests when to call again: it backs off while
+    the queue is empty and shortens while batches come back full.
     """
+    if not sync:
+        try:
+            saturated = await asyncio.to_thread(_workers_saturated)
+        except Exception as e:
+            logger.warning(f"Could not inspect Celery workers: {e}")
+            saturated = False
+        if saturated:
+            response.headers["X-Next-Poll-Ms"] = str(_next_pending_poll_ms(0, limit))
+            return MessageResponse(message="Workers saturated, skipping poll")
+
     result = await db.execute(
         select(IngestJob)
         .where(IngestJob.status == "pending")
@@ -73,34 +200,40 @@ async def process_pending_jobs(
     )
     jobs = list(result.scalars().all())
 
+    response.headers["X-Next-Poll-Ms"] = str(_next_pending_poll_ms(len(jobs), limit))
+
     if not jobs:
         return MessageResponse(message="No pending jobs found")
 
+    # Load every job's asset with one IN query (IngestJob has no relationship
+    # to the partitioned assets table)
+    assets: dict[UUID, Asset] = {}
+    if sync:
+        asset_result = await db.execute(
+            select(Asset).where(Asset.id.in_({job.asset_id for job in jobs}))
+        )
+        assets = {asset.id: asset for asset in asset_result.scalars()}
+
     dispatched = 0
     errors = []
 
-    for job in jobs:
+    if sync:
+        # Process synchronously
+        for job in jobs:
+            try:
+                await _process_job_sync(db, job, assets.get(job.asset_id))
+                dispatched += 1
+            except Exception as e:
+                errors.append(f"{job.id}: {str(e)}")
+                logger.error(f"Failed to process job {job.id}: {e}")
+    else:
+        # Dispatch to Celery
         try:
-            if sync:
-                # Process synchronously
-                await _process_job_sync(db, job)
-            else:
-                # Dispatch to Celery
-                from app.workers.tasks.metadata import extract_metadata
-                from app.workers.tasks.proxy import generate_proxy
-                from app.workers.tasks.thumbnail import generate_thumbnail
-
-                if job.job_type == "metadata":
-                    extract_metadata.delay(str(job.id), str(job.asset_id), job.input_path)
-                elif job.job_type == "proxy":
-                    generate_proxy.delay(str(job.id), str(job.asset_id), job.input_path)
-                elif job.job_type == "thumbnail":
-                    generate_thumbnail.delay(str(job.id), str(job.asset_id), job.input_path)
-
-            dispatched += 1
+            _dispatch_jobs(jobs)
+            dispatched = len(jobs)
         except Exception as e:
-            errors.append(f"{job.id}: {str(e)}")
-            logger.error(f"Failed to process job {job.id}: {e}")
+            errors.append(str(e))
+            logger.error(f"Failed to dispatch {len(jobs)} jobs: {e}")
 
     message = f"Processed {dispatched}/{len(jobs)} jobs"
     if errors:
@@ -131,41 +264,44 @@ async def get_job(job_id: UUID, db: DbSession):
 @router.post("/{job_id}/retry", response_model=MessageResponse)
 async def retry_job(job_id: UUID, db: DbSession):
     """Retry a failed job."""
-    result = await db.execute(select(IngestJob).where(IngestJob.id == job_id))
-    job = result.scalar_one_or_none()
-
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
+    # Reset the job only if it is still retryable, in one statement
+    result = await db.execute(
+        update(IngestJob)
+        .where(
+            IngestJob.id == job_id,
+            IngestJob.status.in_(("failed", "cancelled")),
+        )
+        .values(
+            status="pending",
+            progress=0,
+            error_message=None,
+            started_at=None,
+            completed_at=None,
+            worker_id=None,
+        )
+        .returning(
+            IngestJob.id,
+            IngestJob.job_type,
+            IngestJob.asset_id,
+            IngestJob.input_path,
+        )
+    )
+    job = result.first()
 
-    if job.status not in ("failed", "cancelled"):
+    if job is None:
+        current_status = await db.scalar(
+            select(IngestJob.status).where(IngestJob.id == job_id)
+        )
+        if current_status is None:
+            raise HTTPException(status_code=404, detail="Job not found")
         raise HTTPException(
             status_code=400,
-            detail=f"Can only retry failed or cancelled jobs, current status: {job.status}",
+            detail=f"Can only retry failed or cancelled jobs, current status: {current_status}",
         )
 
-    # Reset job
-    job.status = "pending"
-    job.progress = 0
-    job.error_message = None
-    job.started_at = None
-    job.completed_at = None
-    job.worker_id = None
-
-    await db.flush()
-
     # Try to dispatch to Celery
     try:
-        from app.workers.tasks.metadata import extract_metadata
-        from app.workers.tasks.proxy import generate_proxy
-        from app.workers.tasks.thumbnail import generate_thumbnail
-
-        if job.job_type == "metadata":
-            extract_metadata.delay(str(job.id), str(job.asset_id), job.input_path)
-        elif job.job_type == "proxy":
-            generate_proxy.delay(str(job.id), str(job.asset_id), job.input_path)
-        elif job.job_type == "thumbnail":
-            generate_thumbnail.delay(str(job.id), str(job.asset_id), job.input_path)
-
+        _dispatch_job(job)
         logger.info(f"Dispatched retry for job {job.id}")
     except Exception as e:
         logger.warning(f"Could not dispatch to Celery: {e}")
@@ -173,11 +309,93 @@ async def retry_job(job_id: UUID, db: DbSession):
     return MessageResponse(message=f"Job {job_id} queued for retry", id=job_id)
 
 
-async def _process_job_sync(db: DbSession, job: IngestJob):
-    """Process a job synchronously using FFmpeg/FFprobe (for when Celery is not available)."""
+async def _run_command(cmd: list[str], timeout: float) -> tuple[int, str, str]:
+    """Run a command without blocking the event loop; returns (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except BaseException:
+        # Timed out or cancelled - don't leave FFmpeg running
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    return (
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+class _CountingReader:
+    """Read-only file wrapper that counts the bytes read through it."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+async def _run_command_to_storage(
+    cmd: list[str],
+    timeout: float,
+    storage,
+    **upload_kwargs,
+) -> tuple[int, str, str, int]:
+    """
+    Run a command and stream its stdout straight into storage.
+
+    Returns (returncode, stderr, storage path, bytes uploaded). The object is
+    removed again if the command fails, times out or is cancelled, since it
+    may hold partial output.
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        reader = _CountingReader(proc.stdout)
+        # Shielded so a timeout leaves the upload running and its path reachable
+        upload = asyncio.ensure_future(storage.upload_file(file_obj=reader, **upload_kwargs))
+        try:
+            path = await asyncio.wait_for(asyncio.shield(upload), timeout=timeout)
+            returncode = await asyncio.to_thread(proc.wait)
+        except BaseException:
+            # Timed out or cancelled - killing FFmpeg hands the upload an EOF, so
+            # it finishes with a truncated object that has to be removed
+            proc.kill()
+            await asyncio.to_thread(proc.wait)
+            try:
+                path = await upload
+            except Exception:
+                pass
+            else:
+                await storage.delete_file(upload_kwargs["bucket"], path)
+            raise
+        finally:
+            proc.stdout.close()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace")
+
+    if returncode != 0:
+        await storage.delete_file(upload_kwargs["bucket"], path)
+    return returncode, stderr, path, reader.bytes_read
+
+
+async def _process_job_sync(db: DbSession, job: IngestJob, asset: Asset | None = None):
+    """
+    Process a job synchronously using FFmpeg/FFprobe (for when Celery is not available).
+
+    `asset` may be passed in when the caller already loaded it; otherwise it
+    is fetched once here.
+    """
     import json
-    import subprocess
-    import tempfile
     from pathlib import Path
 
     from app.core.config import settings
@@ -188,9 +406,12 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
     job.started_at = datetime.utcnow()
     await db.flush()
 
+    if asset is None:
+        result = await db.execute(select(Asset).where(Asset.id == job.asset_id))
+        asset = result.scalar_one_or_none()
+
     storage = StorageService()
     temp_input = None
-    temp_output = None
 
     try:
         # Download file from storage
@@ -218,19 +439,15 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
                 "-show_streams",
                 temp_input,
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            returncode, stdout, stderr = await _run_command(cmd, timeout=60)
 
-            if result.returncode == 0:
-                ffprobe_data = json.loads(result.stdout)
+            if returncode == 0:
+                ffprobe_data = json.loads(stdout)
                 metadata = _parse_ffprobe_output(ffprobe_data)
 
                 # Extract duration (goes to Asset, not TechnicalMetadata)
                 duration_ms = metadata.pop("_duration_ms", None)
 
-                # Get asset for tenant_id
-                asset_result = await db.execute(select(Asset).where(Asset.id == job.asset_id))
-                asset = asset_result.scalar_one_or_none()
-
                 if asset:
                     # Filter only valid TechnicalMetadata fields
                     tech_meta_fields = {
@@ -238,23 +455,23 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
                         if v is not None and not k.startswith("_")
                     }
 
-                    # Update or create technical metadata
-                    existing = await db.get(AssetTechnicalMetadata, job.asset_id)
-                    if existing:
-                        for key, value in tech_meta_fields.items():
-                            setattr(existing, key, value)
-                        existing.ffprobe_raw = ffprobe_data
-                        existing.analyzed_at = datetime.utcnow()
-                    else:
-                        tech_meta = AssetTechnicalMetadata(
+                    # Create or update technical metadata in one statement,
+                    # keyed on the unique asset_id
+                    analyzed = {
+                        **tech_meta_fields,
+                        "ffprobe_raw": ffprobe_data,
+                        "analyzed_at": datetime.utcnow(),
+                    }
+                    await db.execute(
+                        pg_insert(AssetTechnicalMetadata)
+                        .values(
                             asset_id=job.asset_id,
                             tenant_id=asset.tenant_id,
-                            ffprobe_raw=ffprobe_data,
-                            analyzed_at=datetime.utcnow(),
                             analyzer_version="ffprobe",
-                            **tech_meta_fields,
+                            **analyzed,
                         )
-                        db.add(tech_meta)
+                        .on_conflict_do_update(index_elements=["asset_id"], set_=analyzed)
+                    )
 
                     # Update asset duration
                     if duration_ms:
@@ -263,16 +480,15 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
                 job.result = {**metadata, "duration_ms": duration_ms}
                 logger.info(f"Metadata extracted: {metadata.get('video_codec')}, {metadata.get('width')}x{metadata.get('height')}, duration={duration_ms}ms")
             else:
-                raise Exception(f"FFprobe failed: {result.stderr}")
+                raise Exception(f"FFprobe failed: {stderr}")
 
         elif job.job_type == "proxy":
-            # Generate proxy with FFmpeg
-            temp_output = tempfile.mktemp(suffix="_proxy.mp4")
+            # Generate proxy with FFmpeg, streaming it to storage as it encodes.
+            # faststart needs a seekable output, so write a fragmented MP4.
             width, height = settings.proxy_resolution.split("x")
 
             cmd = [
                 settings.ffmpeg_path,
-                "-y",
                 "-i", temp_input,
                 "-c:v", "libx264",
                 "-preset", settings.proxy_preset,
@@ -280,29 +496,23 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
                 "-vf", f"scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2",
                 "-c:a", "aac",
                 "-b:a", "128k",
-                "-movflags", "+faststart",
-                temp_output,
+                "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+                "-f", "mp4",
+                "pipe:1",
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
-
-            if result.returncode == 0 and Path(temp_output).exists():
-                # Upload proxy
-                with open(temp_output, "rb") as f:
-                    proxy_content = f.read()
-
-                proxy_path = await storage.upload_file(
-                    content=proxy_content,
-                    filename=f"{job.asset_id}_proxy.mp4",
-                    asset_id=str(job.asset_id),
-                    tenant_code="dev",
-                    purpose="proxy",
-                    bucket=storage.bucket_proxies,
-                )
-
-                # Get asset for tenant_id
-                asset_result = await db.execute(select(Asset).where(Asset.id == job.asset_id))
-                asset = asset_result.scalar_one_or_none()
+            returncode, stderr, proxy_path, file_size = await _run_command_to_storage(
+                cmd,
+                timeout=3600,
+                storage=storage,
+                filename=f"{job.asset_id}_proxy.mp4",
+                asset_id=str(job.asset_id),
+                tenant_code="dev",
+                purpose="proxy",
+                bucket=storage.bucket_proxies,
+                content_type="video/mp4",
+            )
 
+            if returncode == 0:
                 if asset:
                     # Create storage location
                     storage_location = AssetStorageLocation(
@@ -313,21 +523,20 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
                         bucket=storage.bucket_proxies,
                         path=proxy_path,
                         filename=f"{job.asset_id}_proxy.mp4",
-                        file_size_bytes=len(proxy_content),
+                        file_size_bytes=file_size,
                         purpose="proxy",
                         is_primary=False,
                     )
                     db.add(storage_location)
 
                 job.output_path = proxy_path
-                job.result = {"path": proxy_path, "size": len(proxy_content)}
-                logger.info(f"Proxy generated: {proxy_path} ({len(proxy_content)} bytes)")
+                job.result = {"path": proxy_path, "size": file_size}
+                logger.info(f"Proxy generated: {proxy_path} ({file_size} bytes)")
             else:
-                raise Exception(f"FFmpeg proxy failed: {result.stderr}")
+                raise Exception(f"FFmpeg proxy failed: {stderr}")
 
         elif job.job_type == "thumbnail":
-            # Generate thumbnail with FFmpeg
-            temp_output = tempfile.mktemp(suffix=".jpg")
+            # Generate thumbnail with FFmpeg, piping the JPEG straight to storage
 
             # Get duration for timestamp
             duration_cmd = [
@@ -337,8 +546,8 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 temp_input,
             ]
-            dur_result = subprocess.run(duration_cmd, capture_output=True, text=True, timeout=30)
-            duration = float(dur_result.stdout.strip()) if dur_result.returncode == 0 else 0
+            dur_returncode, dur_stdout, _ = await _run_command(duration_cmd, timeout=30)
+            duration = float(dur_stdout.strip()) if dur_returncode == 0 else 0
 
             # Pick timestamp at 10% or 1 second
             timestamp_sec = max(1, duration * 0.1) if duration > 10 else (1 if duration > 1 else 0)
@@ -352,28 +561,23 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
                 "-vframes", "1",
                 "-vf", f"scale={settings.thumbnail_width}:{settings.thumbnail_height}:force_original_aspect_ratio=decrease,pad={settings.thumbnail_width}:{settings.thumbnail_height}:(ow-iw)/2:(oh-ih)/2",
                 "-q:v", "2",
-                temp_output,
+                "-f", "image2pipe",
+                "-c:v", "mjpeg",
+                "pipe:1",
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode == 0 and Path(temp_output).exists():
-                # Upload thumbnail
-                with open(temp_output, "rb") as f:
-                    thumb_content = f.read()
-
-                thumb_path = await storage.upload_file(
-                    content=thumb_content,
-                    filename=f"{job.asset_id}_thumb.jpg",
-                    asset_id=str(job.asset_id),
-                    tenant_code="dev",
-                    purpose="thumbnail",
-                    bucket=storage.bucket_thumbnails,
-                )
-
-                # Get asset for tenant_id
-                asset_result = await db.execute(select(Asset).where(Asset.id == job.asset_id))
-                asset = asset_result.scalar_one_or_none()
+            returncode, stderr, thumb_path, file_size = await _run_command_to_storage(
+                cmd,
+                timeout=60,
+                storage=storage,
+                filename=f"{job.asset_id}_thumb.jpg",
+                asset_id=str(job.asset_id),
+                tenant_code="dev",
+                purpose="thumbnail",
+                bucket=storage.bucket_thumbnails,
+                content_type="image/jpeg",
+            )
 
+            if returncode == 0:
                 if asset:
                     # Create storage location
                     storage_location = AssetStorageLocation(
@@ -384,17 +588,17 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
                         bucket=storage.bucket_thumbnails,
                         path=thumb_path,
                         filename=f"{job.asset_id}_thumb.jpg",
-                        file_size_bytes=len(thumb_content),
+                        file_size_bytes=file_size,
                         purpose="thumbnail",
                         is_primary=False,
                     )
                     db.add(storage_location)
 
                 job.output_path = thumb_path
-                job.result = {"path": thumb_path, "size": len(thumb_content)}
-                logger.info(f"Thumbnail generated: {thumb_path} ({len(thumb_content)} bytes)")
+                job.result = {"path": thumb_path, "size": file_size}
+                logger.info(f"Thumbnail generated: {thumb_path} ({file_size} bytes)")
             else:
-                raise Exception(f"FFmpeg thumbnail failed: {result.stderr}")
+                raise Exception(f"FFmpeg thumbnail failed: {stderr}")
 
         # Mark job complete
         job.status = "completed"
@@ -402,21 +606,20 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
         job.completed_at = datetime.utcnow()
 
         # Check if all jobs for this asset are complete
-        result = await db.execute(
-            select(IngestJob).where(
-                IngestJob.asset_id == job.asset_id,
-                IngestJob.status.in_(("pending", "processing")),
-                IngestJob.id != job.id,
+        has_pending = await db.scalar(
+            select(
+                select(IngestJob.id)
+                .where(
+                    IngestJob.asset_id == job.asset_id,
+                    IngestJob.status.in_(("pending", "processing")),
+                    IngestJob.id != job.id,
+                )
+                .exists()
             )
         )
-        pending = list(result.scalars().all())
 
-        if not pending:
+        if not has_pending:
             # All jobs complete - update asset status
-            asset_result = await db.execute(
-                select(Asset).where(Asset.id == job.asset_id)
-            )
-            asset = asset_result.scalar_one_or_none()
             if asset:
                 asset.status = "available"
                 logger.info(f"Asset {asset.id} marked as available")
@@ -433,11 +636,28 @@ async def _process_job_sync(db: DbSession, job: IngestJob):
         raise
 
     finally:
-        # Cleanup temp files
+        # Cleanup temp file
         if temp_input and Path(temp_input).exists():
             Path(temp_input).unlink(missing_ok=True)
-        if temp_output and Path(temp_output).exists():
-            Path(temp_output).unlink(missing_ok=True)
+
+
+# FFprobe stream keys copied as-is into technical metadata fields
+_FFPROBE_VIDEO_FIELDS = (
+    ("width", "width"),
+    ("height", "height"),
+    ("video_codec", "codec_name"),
+    ("video_codec_profile", "profile"),
+)
+_FFPROBE_AUDIO_FIELDS = (
+    ("audio_codec", "codec_name"),
+    ("audio_channels", "channels"),
+    ("audio_channel_layout", "channel_layout"),
+)
+
+
+def _int_or_none(value) -> int | None:
+    """FFprobe reports numbers such as bit_rate as strings; 0 or missing means unknown."""
+    return int(value) or None if value is not None else None
 
 
 def _parse_ffprobe_output(data: dict) -> dict:
@@ -447,41 +667,45 @@ def _parse_ffprobe_output(data: dict) -> dict:
     - Technical metadata fields (for AssetTechnicalMetadata)
     - _duration_ms: duration in milliseconds (for Asset table, prefixed to indicate special handling)
     """
-    metadata = {}
-
     # Get format info
     format_info = data.get("format", {})
-    metadata["container_format"] = format_info.get("format_name", "").split(",")[0]
-    # Store duration separately (goes in Asset table, not TechnicalMetadata)
-    metadata["_duration_ms"] = int(float(format_info.get("duration", 0)) * 1000)
+    metadata = {
+        "container_format": format_info.get("format_name", "").split(",", 1)[0],
+        # Store duration separately (goes in Asset table, not TechnicalMetadata)
+        "_duration_ms": int(float(format_info.get("duration", 0)) * 1000),
+    }
 
-    # Find video and audio streams
+    # Find the first video and audio streams, stopping once both are seen
     video_stream = None
     audio_stream = None
 
-    for stream in data.get("streams", []):
+    for stream in data.get("streams", ()):
         codec_type = stream.get("codec_type")
-        if codec_type == "video" and not video_stream:
-            video_stream = stream
-        elif codec_type == "audio" and not audio_stream:
-            audio_stream = stream
+        if codec_type == "video":
+            if video_stream is None:
+                video_stream = stream
+        elif codec_type == "audio":
+            if audio_stream is None:
+                audio_stream = stream
+        else:
+            continue
+        if video_stream is not None and audio_stream is not None:
+            break
 
     # Video metadata
-    if video_stream:
-        metadata["width"] = video_stream.get("width")
-        metadata["height"] = video_stream.get("height")
-        metadata["video_codec"] = video_stream.get("codec_name")
-        metadata["video_codec_profile"] = video_stream.get("profile")
-        metadata["video_bitrate_bps"] = int(video_stream.get("bit_rate", 0)) or None
+    if video_stream is not None:
+        for field, key in _FFPROBE_VIDEO_FIELDS:
+            metadata[field] = video_stream.get(key)
+        metadata["video_bitrate_bps"] = _int_or_none(video_stream.get("bit_rate"))
 
         # Frame rate
-        r_frame_rate = video_stream.get("r_frame_rate", "0/1")
-        if "/" in r_frame_rate:
-            num, den = r_frame_rate.split("/")
-            metadata["frame_rate_num"] = int(num)
-            metadata["frame_rate_den"] = int(den)
-            if int(den) > 0:
-                metadata["frame_rate"] = float(num) / float(den)
+        num, sep, den = video_stream.get("r_frame_rate", "0/1").partition("/")
+        if sep:
+            num, den = int(num), int(den)
+            metadata["frame_rate_num"] = num
+            metadata["frame_rate_den"] = den
+            if den > 0:
+                metadata["frame_rate"] = num / den
 
         # Aspect ratio
         dar = video_stream.get("display_aspect_ratio")
@@ -489,11 +713,10 @@ def _parse_ffprobe_output(data: dict) -> dict:
             metadata["aspect_ratio"] = dar
 
     # Audio metadata
-    if audio_stream:
-        metadata["audio_codec"] = audio_stream.get("codec_name")
-        metadata["audio_sample_rate"] = int(audio_stream.get("sample_rate", 0)) or None
-        metadata["audio_channels"] = audio_stream.get("channels")
-        metadata["audio_channel_layout"] = audio_stream.get("channel_layout")
-        metadata["audio_bitrate_bps"] = int(audio_stream.get("bit_rate", 0)) or None
+    if audio_stream is not None:
+        for field, key in _FFPROBE_AUDIO_FIELDS:
+            metadata[field] = audio_stream.get(key)
+        metadata["audio_sample_rate"] = _int_or_none(audio_stream.get("sample_rate"))
+        metadata["audio_bitrate_bps"] = _int_or_none(audio_stream.get("bit_rate"))
 
     return metadata
@@ -6,7 +6,9 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import Integer, String, bindparam, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.api.deps import DbSession, get_tenant_by_code
 from app.models import Asset, AssetKeyword
@@ -23,6 +25,45 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_keyword_list = TypeAdapter(list[KeywordRead])
+
+# Minimum pg_trgm word similarity for a keyword search hit
+KEYWORD_SEARCH_THRESHOLD = 0.3
+
+_keyword_search_settings = text(
+    "SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"
+)
+
+
+def _keyword_search_statement(by_tenant: bool):
+    """Build the keyword search query once, with the term, tenant and limit bound."""
+    term = bindparam("q", type_=String())
+    query = (
+        select(
+            AssetKeyword.id,
+            AssetKeyword.asset_id,
+            AssetKeyword.keyword,
+            AssetKeyword.start_ms,
+            AssetKeyword.end_ms,
+            Asset.title.label("asset_title"),
+            Asset.asset_type.label("asset_type"),
+        )
+        .join(Asset, Asset.id == AssetKeyword.asset_id)
+        .where(term.op("<%")(AssetKeyword.keyword))
+    )
+    if by_tenant:
+        query = query.where(AssetKeyword.tenant_id == bindparam("tenant_id"))
+    return query.order_by(
+        func.word_similarity(term, AssetKeyword.keyword).desc(),
+        AssetKeyword.keyword,
+    ).limit(bindparam("limit", type_=Integer()))
+
+
+# Separate statements rather than a NULL tenant sentinel, so each gets its own plan
+_keyword_search = _keyword_search_statement(by_tenant=False)
+_keyword_search_by_tenant = _keyword_search_statement(by_tenant=True)
+
 
 # =============================================================================
 # Asset Keywords Routes
@@ -40,30 +81,34 @@ async def list_asset_keywords(
     List all keywords for a specific asset.
     """
     # Verify asset exists
-    asset_result = await db.execute(select(Asset).where(Asset.id == asset_id))
-    asset = asset_result.scalar_one_or_none()
-    if not asset:
+    asset_exists = await db.scalar(select(select(Asset.id).where(Asset.id == asset_id).exists()))
+    if not asset_exists:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    # Get keywords
+    # Get keywords with the total count as a window over the same rows
     query = (
-        select(AssetKeyword)
+        select(AssetKeyword, func.count().over().label("total"))
         .where(AssetKeyword.asset_id == asset_id)
         .order_by(AssetKeyword.start_ms.nulls_last(), AssetKeyword.keyword)
         .limit(limit)
         .offset(offset)
     )
-    result = await db.execute(query)
-    keywords = list(result.scalars().all())
-
-    # Count total
-    count_result = await db.execute(
-        select(func.count()).where(AssetKeyword.asset_id == asset_id)
-    )
-    total = count_result.scalar() or 0
+    rows = (await db.execute(query)).all()
+    keywords = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Paged past the end - the window has no row to report the total on
+        count_result = await db.execute(
+            select(func.count()).where(AssetKeyword.asset_id == asset_id)
+        )
+        total = count_result.scalar() or 0
+    else:
+        total = 0
 
     return KeywordListResponse(
-        items=[KeywordRead.model_validate(k) for k in keywords],
+        items=_keyword_list.validate_python(keywords, from_attributes=True),
         total=total,
     )
 
@@ -78,40 +123,34 @@ async def create_keyword(
     Add a keyword to an asset.
     """
     # Verify asset exists
-    asset_result = await db.execute(select(Asset).where(Asset.id == asset_id))
-    asset = asset_result.scalar_one_or_none()
+    asset_result = await db.execute(select(Asset.tenant_id).where(Asset.id == asset_id))
+    asset = asset_result.first()
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    # Check for duplicate
-    existing = await db.execute(
-        select(AssetKeyword).where(
-            AssetKeyword.asset_id == asset_id,
-            AssetKeyword.keyword == data.keyword,
-            AssetKeyword.start_ms == data.start_ms,
+    # Create keyword; the unique (asset_id, keyword, start_ms) index rejects duplicates
+    result = await db.execute(
+        pg_insert(AssetKeyword)
+        .values(
+            asset_id=asset_id,
+            tenant_id=asset.tenant_id,
+            keyword=data.keyword,
+            start_ms=data.start_ms,
+            end_ms=data.end_ms,
+            note=data.note,
+            source=data.source,
+            confidence=data.confidence,
         )
+        .on_conflict_do_nothing(index_elements=["asset_id", "keyword", "start_ms"])
+        .returning(AssetKeyword)
     )
-    if existing.scalar_one_or_none():
+    keyword = result.scalar_one_or_none()
+    if keyword is None:
         raise HTTPException(
             status_code=400,
             detail="Keyword already exists at this time position",
         )
 
-    # Create keyword
-    keyword = AssetKeyword(
-        asset_id=asset_id,
-        tenant_id=asset.tenant_id,
-        keyword=data.keyword,
-        start_ms=data.start_ms,
-        end_ms=data.end_ms,
-        note=data.note,
-        source=data.source,
-        confidence=data.confidence,
-    )
-    db.add(keyword)
-    await db.flush()
-    await db.refresh(keyword)
-
     logger.info(f"Keyword '{data.keyword}' added to asset {asset_id}")
     return KeywordRead.model_validate(keyword)
 
@@ -132,34 +171,25 @@ async def search_keywords(
     Search keywords across all assets.
     Returns keywords matching the search term with asset information.
     """
-    # Get tenant if specified
-    tenant_id = None
-    if tenant_code:
-        tenant = await get_tenant_by_code(db, tenant_code)
-        tenant_id = tenant.id
-
-    # Build search query using ILIKE (simple search)
-    # Note: The table has a GIN trigram index for more advanced search
-    query = (
-        select(
-            AssetKeyword.id,
-            AssetKeyword.asset_id,
-            AssetKeyword.keyword,
-            AssetKeyword.start_ms,
-            AssetKeyword.end_ms,
-            Asset.title.label("asset_title"),
-            Asset.asset_type.label("asset_type"),
-        )
-        .join(Asset, Asset.id == AssetKeyword.asset_id)
-        .where(AssetKeyword.keyword.ilike(f"%{q}%"))
-    )
+    q = q.strip()
+    if not q:
+        return []
 
-    if tenant_id:
-        query = query.where(AssetKeyword.tenant_id == tenant_id)
+    tenant = await get_tenant_by_code(db, tenant_code) if tenant_code else None
 
-    query = query.order_by(AssetKeyword.keyword).limit(limit)
+    # Match with the pg_trgm word similarity operator, which idx_keywords_trgm
+    # serves directly; the threshold is transaction-local like SET LOCAL
+    await db.execute(
+        _keyword_search_settings, {"threshold": str(KEYWORD_SEARCH_THRESHOLD)}
+    )
+
+    if tenant:
+        result = await db.execute(
+            _keyword_search_by_tenant, {"q": q, "tenant_id": tenant.id, "limit": limit}
+        )
+    else:
+        result = await db.execute(_keyword_search, {"q": q, "limit": limit})
 
-    result = await db.execute(query)
     rows = result.all()
 
     return [
@@ -209,22 +239,21 @@ async def update_keyword(
     """
     Update a keyword.
     """
-    result = await db.execute(
-        select(AssetKeyword).where(AssetKeyword.id == keyword_id)
-    )
-    keyword = result.scalar_one_or_none()
+    update_data = data.model_dump(exclude_unset=True)
+    if update_data:
+        # RETURNING picks up keyword_normalized, which a trigger sets on keyword changes
+        keyword = await db.scalar(
+            update(AssetKeyword)
+            .where(AssetKeyword.id == keyword_id)
+            .values(**update_data)
+            .returning(AssetKeyword)
+        )
+    else:
+        keyword = await db.scalar(select(AssetKeyword).where(AssetKeyword.id == keyword_id))
 
     if not keyword:
         raise HTTPException(status_code=404, detail="Keyword not found")
 
-    # Update fields
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(keyword, field, value)
-
-    await db.flush()
-    await db.refresh(keyword)
-
     logger.info(f"Keyword {keyword_id} updated")
     return KeywordRead.model_validate(keyword)
 
@@ -6,7 +6,8 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, insert, select, update
 
 from app.api.deps import DbSession
 from app.models import Asset, AssetMarker
@@ -22,6 +23,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_marker_list = TypeAdapter(list[MarkerRead])
+
 
 # =============================================================================
 # Asset Markers Routes
@@ -41,14 +45,13 @@ async def list_asset_markers(
     Ordered by start time.
     """
     # Verify asset exists
-    asset_result = await db.execute(select(Asset).where(Asset.id == asset_id))
-    asset = asset_result.scalar_one_or_none()
-    if not asset:
+    asset_exists = await db.scalar(select(select(Asset.id).where(Asset.id == asset_id).exists()))
+    if not asset_exists:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    # Build query
+    # Build query, with the total count as a window over the same rows
     query = (
-        select(AssetMarker)
+        select(AssetMarker, func.count().over().label("total"))
         .where(AssetMarker.asset_id == asset_id)
     )
 
@@ -57,18 +60,23 @@ async def list_asset_markers(
 
     query = query.order_by(AssetMarker.start_ms).limit(limit).offset(offset)
 
-    result = await db.execute(query)
-    markers = list(result.scalars().all())
-
-    # Count total
-    count_query = select(func.count()).where(AssetMarker.asset_id == asset_id)
-    if marker_type:
-        count_query = count_query.where(AssetMarker.marker_type == marker_type)
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    rows = (await db.execute(query)).all()
+    markers = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Paged past the end - the window has no row to report the total on
+        count_query = select(func.count()).where(AssetMarker.asset_id == asset_id)
+        if marker_type:
+            count_query = count_query.where(AssetMarker.marker_type == marker_type)
+        count_result = await db.execute(count_query)
+        total = count_result.scalar() or 0
+    else:
+        total = 0
 
     return MarkerListResponse(
-        items=[MarkerRead.model_validate(m) for m in markers],
+        items=_marker_list.validate_python(markers, from_attributes=True),
         total=total,
     )
 
@@ -83,8 +91,10 @@ async def create_marker(
     Create a new marker on an asset.
     """
     # Verify asset exists
-    asset_result = await db.execute(select(Asset).where(Asset.id == asset_id))
-    asset = asset_result.scalar_one_or_none()
+    asset_result = await db.execute(
+        select(Asset.tenant_id, Asset.duration_ms).where(Asset.id == asset_id)
+    )
+    asset = asset_result.first()
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
@@ -95,26 +105,28 @@ async def create_marker(
             detail=f"start_ms ({data.start_ms}) exceeds asset duration ({asset.duration_ms}ms)",
         )
 
-    # Create marker
-    marker = AssetMarker(
-        asset_id=asset_id,
-        tenant_id=asset.tenant_id,
-        marker_type=data.marker_type,
-        name=data.name,
-        color=data.color,
-        start_ms=data.start_ms,
-        duration_ms=data.duration_ms,
-        note=data.note,
-        keywords=data.keywords,
-        source=data.source,
-        extra=data.extra,
+    # Create marker, reading back server defaults in the same statement
+    result = await db.execute(
+        insert(AssetMarker)
+        .values(
+            asset_id=asset_id,
+            tenant_id=asset.tenant_id,
+            marker_type=data.marker_type,
+            name=data.name,
+            color=data.color,
+            start_ms=data.start_ms,
+            duration_ms=data.duration_ms,
+            note=data.note,
+            keywords=data.keywords,
+            source=data.source,
+            extra=data.extra,
+        )
+        .returning(AssetMarker)
     )
-    db.add(marker)
-    await db.flush()
-    await db.refresh(marker)
+    marker = result.scalar_one()
 
     logger.info(f"Marker '{data.marker_type}' created at {data.start_ms}ms on asset {asset_id}")
-    return MarkerRead.model_validate(marker)
+    return MarkerRead.from_orm_unsafe(marker)
 
 
 # =============================================================================
@@ -138,7 +150,7 @@ async def get_marker(
     if not marker:
         raise HTTPException(status_code=404, detail="Marker not found")
 
-    return MarkerRead.model_validate(marker)
+    return MarkerRead.from_orm_unsafe(marker)
 
 
 @router.patch("/markers/{marker_id}", response_model=MarkerRead)
@@ -150,24 +162,18 @@ async def update_marker(
     """
     Update a marker.
     """
-    result = await db.execute(
-        select(AssetMarker).where(AssetMarker.id == marker_id)
+    marker = await db.scalar(
+        update(AssetMarker)
+        .where(AssetMarker.id == marker_id)
+        .values(**data.model_dump(exclude_unset=True))
+        .returning(AssetMarker)
     )
-    marker = result.scalar_one_or_none()
 
     if not marker:
         raise HTTPException(status_code=404, detail="Marker not found")
 
-    # Update fields
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(marker, field, value)
-
-    await db.flush()
-    await db.refresh(marker)
-
     logger.info(f"Marker {marker_id} updated")
-    return MarkerRead.model_validate(marker)
+    return MarkerRead.from_orm_unsafe(marker)
 
 
 @router.delete("/markers/{marker_id}", response_model=MessageResponse)
@@ -178,16 +184,12 @@ async def delete_marker(
     """
     Delete a marker.
     """
-    result = await db.execute(
-        select(AssetMarker).where(AssetMarker.id == marker_id)
+    deleted = await db.scalar(
+        delete(AssetMarker).where(AssetMarker.id == marker_id).returning(AssetMarker.id)
     )
-    marker = result.scalar_one_or_none()
 
-    if not marker:
+    if not deleted:
         raise HTTPException(status_code=404, detail="Marker not found")
 
-    await db.delete(marker)
-    await db.flush()
-
     logger.info(f"Marker {marker_id} deleted")
     return MessageResponse(message="Marker deleted", id=marker_id)
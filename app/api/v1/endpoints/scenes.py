@@ -2,11 +2,15 @@
 Scene description API endpoints.
 """
 
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Select, bindparam, insert, literal, select, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 
 from app.api.deps import get_current_user, get_db, get_tenant_id
 from app.models.asset import Asset
@@ -21,6 +25,116 @@ from app.schemas.scene import (
 
 router = APIRouter()
 
+# Rows fetched per server-side cursor round trip by the streamed list endpoints
+STREAM_BATCH_SIZE = 256
+
+# SceneDescriptionRead / AIKeywordRead fields as plain columns, so rows are
+# validated straight from the cursor without building ORM objects
+_scene_columns = (
+    AssetSceneDescription.id,
+    AssetSceneDescription.asset_id,
+    AssetSceneDescription.tenant_id,
+    AssetSceneDescription.timecode_start_ms,
+    AssetSceneDescription.timecode_end_ms,
+    (
+        AssetSceneDescription.timecode_end_ms - AssetSceneDescription.timecode_start_ms
+    ).label("duration_ms"),
+    AssetSceneDescription.description,
+    AssetSceneDescription.objects,
+    AssetSceneDescription.actions,
+    AssetSceneDescription.emotions,
+    AssetSceneDescription.text_ocr,
+    AssetSceneDescription.model_version,
+    AssetSceneDescription.created_at,
+)
+_ai_keyword_columns = (
+    AIExtractedKeyword.id,
+    AIExtractedKeyword.asset_id,
+    AIExtractedKeyword.keyword,
+    AIExtractedKeyword.keyword_normalized,
+    AIExtractedKeyword.category,
+    AIExtractedKeyword.confidence,
+    AIExtractedKeyword.source,
+    AIExtractedKeyword.start_ms,
+    AIExtractedKeyword.end_ms,
+    AIExtractedKeyword.created_at,
+)
+
+
+# Response schemas applied to each streamed batch
+_scene_list = TypeAdapter(list[SceneDescriptionRead])
+_ai_keyword_list = TypeAdapter(list[AIKeywordRead])
+
+
+async def _json_array(result: AsyncResult, adapter: TypeAdapter) -> AsyncIterator[bytes]:
+    """Validate and encode a streamed result as a JSON array, one cursor batch per chunk."""
+    separator = b"["
+    async for batch in result.mappings().partitions():
+        items = adapter.validate_python([dict(row) for row in batch])
+        yield separator + adapter.dump_json(items)[1:-1]
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+async def _stream_json_array(
+    db: AsyncSession, query: Select, adapter: TypeAdapter
+) -> StreamingResponse:
+    """Run `query` on a server-side cursor and stream its rows as a JSON array."""
+    result = await db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+    return StreamingResponse(_json_array(result, adapter), media_type="application/json")
+
+
+# Scenes, faces and transcription segments merged and ordered by PostgreSQL
+_asset_timeline = text("""
+    SELECT type, start_ms, end_ms, data
+    FROM (
+        SELECT
+            'scene' AS type,
+            s.timecode_start_ms AS start_ms,
+            s.timecode_end_ms AS end_ms,
+            jsonb_build_object(
+                'id', s.id::text,
+                'description', s.description,
+                'objects', s.objects
+            ) AS data
+        FROM asset_scene_descriptions s
+        WHERE s.tenant_id = :tenant_id AND s.asset_id = :asset_id
+
+        UNION ALL
+
+        SELECT
+            'face',
+            f.timecode_ms,
+            f.timecode_ms + COALESCE(NULLIF(f.duration_ms, 0), 1000),
+            jsonb_build_object(
+                'id', f.id::text,
+                'person_id', f.person_id::text,
+                'thumbnail_url', f.thumbnail_url,
+                'confidence', f.confidence
+            )
+        FROM asset_faces f
+        WHERE f.tenant_id = :tenant_id AND f.asset_id = :asset_id
+
+        UNION ALL
+
+        SELECT
+            'transcription',
+            COALESCE((seg->>'start_ms')::bigint, 0),
+            COALESCE((seg->>'end_ms')::bigint, 0),
+            jsonb_build_object(
+                'text', COALESCE(seg->>'text', ''),
+                'confidence', seg->'confidence'
+            )
+        FROM asset_transcriptions t
+        CROSS JOIN LATERAL jsonb_array_elements(t.segments) AS seg
+        WHERE t.tenant_id = :tenant_id AND t.asset_id = :asset_id
+    ) timeline
+    ORDER BY start_ms
+""").bindparams(
+    bindparam("tenant_id", type_=PG_UUID(as_uuid=True)),
+    bindparam("asset_id", type_=PG_UUID(as_uuid=True)),
+).columns(data=JSONB)
+
 
 @router.get("/{asset_id}/scenes", response_model=list[SceneDescriptionRead])
 async def list_asset_scenes(
@@ -30,13 +144,14 @@ async def list_asset_scenes(
     current_user: User = Depends(get_current_user),
 ):
     """List all scene descriptions for an asset."""
-    result = await db.execute(
-        select(AssetSceneDescription)
+    return await _stream_json_array(
+        db,
+        select(*_scene_columns)
         .where(AssetSceneDescription.asset_id == asset_id)
         .where(AssetSceneDescription.tenant_id == tenant_id)
-        .order_by(AssetSceneDescription.timecode_start_ms)
+        .order_by(AssetSceneDescription.timecode_start_ms),
+        _scene_list,
     )
-    return result.scalars().all()
 
 
 @router.get("/{asset_id}/scenes/{scene_id}", response_model=SceneDescriptionRead)
@@ -76,38 +191,55 @@ async def start_scene_description(
     """Start scene description analysis for an asset."""
     from app.models.asset_storage import IngestJob
 
-    # Verify asset exists
-    result = await db.execute(
-        select(Asset).where(Asset.id == asset_id)
+    # Create the job only if the asset exists in this tenant and can be described
+    job_id = await db.scalar(
+        insert(IngestJob)
+        .from_select(
+            ["asset_id", "tenant_id", "job_type", "status", "priority", "config"],
+            select(
+                Asset.id,
+                Asset.tenant_id,
+                literal("scene_description"),
+                literal("pending"),
+                literal(5),
+                literal(
+                    {
+                        "interval_seconds": request.interval_seconds,
+                        "model": request.model,
+                    },
+                    JSONB,
+                ),
+            )
+            .where(
+                Asset.id == asset_id,
+                Asset.tenant_id == tenant_id,
+                Asset.asset_type.in_(("video", "image")),
+            )
+            .limit(1),
+            include_defaults=False,
+        )
+        .returning(IngestJob.id)
     )
-    asset = result.scalar_one_or_none()
 
-    if not asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asset not found",
+    if job_id is None:
+        # Nothing inserted: tell a missing asset apart from an unsupported type
+        asset_exists = await db.scalar(
+            select(
+                select(Asset.id)
+                .where(Asset.id == asset_id, Asset.tenant_id == tenant_id)
+                .exists()
+            )
         )
-
-    if asset.asset_type not in ("video", "image"):
+        if not asset_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Asset not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Scene description only available for video and image assets",
         )
 
-    # Create job
-    job = IngestJob(
-        asset_id=asset_id,
-        tenant_id=tenant_id,
-        job_type="scene_description",
-        status="pending",
-        priority=5,
-        config={
-            "interval_seconds": request.interval_seconds,
-            "model": request.model,
-        },
-    )
-    db.add(job)
-    await db.flush()
     await db.commit()
 
     # Queue task
@@ -120,7 +252,7 @@ async def start_scene_description(
     )
 
     return DescribeResponse(
-        job_id=job.id,
+        job_id=job_id,
         asset_id=asset_id,
         status="pending",
         message=f"Scene description started with {request.interval_seconds}s intervals",
@@ -138,7 +270,7 @@ async def list_ai_keywords(
 ):
     """List AI-extracted keywords for an asset."""
     query = (
-        select(AIExtractedKeyword)
+        select(*_ai_keyword_columns)
         .where(AIExtractedKeyword.asset_id == asset_id)
         .where(AIExtractedKeyword.tenant_id == tenant_id)
     )
@@ -151,8 +283,7 @@ async def list_ai_keywords(
 
     query = query.order_by(AIExtractedKeyword.confidence.desc())
 
-    result = await db.execute(query)
-    return result.scalars().all()
+    return await _stream_json_array(db, query, _ai_keyword_list)
 
 
 @router.get("/{asset_id}/timeline")
@@ -167,82 +298,22 @@ async def get_asset_timeline(
 
     Returns scenes, faces, and transcription segments in chronological order.
     """
-    from app.models.transcription import AssetTranscription
-    from app.models.person import AssetFace
-
-    # Get scenes
-    scenes_result = await db.execute(
-        select(AssetSceneDescription)
-        .where(AssetSceneDescription.asset_id == asset_id)
-        .where(AssetSceneDescription.tenant_id == tenant_id)
+    result = await db.execute(
+        _asset_timeline, {"tenant_id": tenant_id, "asset_id": asset_id}
     )
-    scenes = scenes_result.scalars().all()
+    timeline = [dict(row) for row in result.mappings()]
 
-    # Get faces
-    faces_result = await db.execute(
-        select(AssetFace)
-        .where(AssetFace.asset_id == asset_id)
-        .where(AssetFace.tenant_id == tenant_id)
-    )
-    faces = faces_result.scalars().all()
+    stats = {"scene": 0, "face": 0, "transcription": 0}
+    for item in timeline:
+        stats[item["type"]] += 1
 
-    # Get transcription segments
-    transcription_result = await db.execute(
-        select(AssetTranscription)
-        .where(AssetTranscription.asset_id == asset_id)
-        .where(AssetTranscription.tenant_id == tenant_id)
-    )
-    transcription = transcription_result.scalar_one_or_none()
-
-    # Build timeline
-    timeline = []
-
-    for scene in scenes:
-        timeline.append({
-            "type": "scene",
-            "start_ms": scene.timecode_start_ms,
-            "end_ms": scene.timecode_end_ms,
-            "data": {
-                "id": str(scene.id),
-                "description": scene.description,
-                "objects": scene.objects,
-            },
-        })
-
-    for face in faces:
-        timeline.append({
-            "type": "face",
-            "start_ms": face.timecode_ms,
-            "end_ms": face.timecode_ms + (face.duration_ms or 1000),
-            "data": {
-                "id": str(face.id),
-                "person_id": str(face.person_id) if face.person_id else None,
-                "thumbnail_url": face.thumbnail_url,
-                "confidence": face.confidence,
-            },
-        })
-
-    if transcription and transcription.segments:
-        for segment in transcription.segments:
-            timeline.append({
-                "type": "transcription",
-                "start_ms": segment.get("start_ms", 0),
-                "end_ms": segment.get("end_ms", 0),
-                "data": {
-                    "text": segment.get("text", ""),
-                    "confidence": segment.get("confidence"),
-                },
-            })
-
-    # Sort by start time
-    timeline.sort(key=lambda x: x["start_ms"])
-
-    return {
+    # Every value is already JSON-native, so skip jsonable_encoder's walk
+    return JSONResponse({
         "asset_id": str(asset_id),
         "timeline": timeline,
         "stats": {
-            "scenes": len(scenes),
-            "faces": len(faces),
-            "transcription_segments": len(transcription.segments) if transcription else 0,
+            "scenes": stats["scene"],
+            "faces": stats["face"],
+            "transcription_segments": stats["transcription"],
         },
-    }
+    })
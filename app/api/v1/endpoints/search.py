@@ -9,8 +9,8 @@ import time
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, literal_column, select, text
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import func, literal_column, select, text, true, union_all
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -31,6 +31,29 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _search_response(payload: SearchResponse) -> Response:
+    """
+    Serialize a search response straight to JSON with pydantic-core.
+
+    The payload is built from trusted rows with model_construct, so FastAPI's
+    response validation and jsonable_encoder pass are skipped; the route's
+    response_model still documents the shape.
+    """
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
+async def _count_beyond_page(db: AsyncSession, query, offset: int) -> int:
+    """
+    Total for a page that came back empty.
+
+    The count window has no row to report on once the offset passes the last
+    match, so count separately - only needed when paging past the end.
+    """
+    if not offset:
+        return 0
+    return await db.scalar(select(func.count()).select_from(query.subquery())) or 0
+
+
 @router.get("", response_model=SearchResponse)
 async def search_assets(
     db: DbSession,
@@ -53,9 +76,8 @@ async def search_assets(
 
     tenant = await get_tenant_by_code(db, tenant_code)
 
-    # Build search query with ts_query
-    # Convert query to tsquery format
-    search_terms = " & ".join(q.split())
+    # Parse the query once; the match, the rank and the headline all reuse it
+    tsquery = select(func.plainto_tsquery("portuguese", q).label("query")).cte("tsq")
 
     # Build the main query
     query = (
@@ -69,22 +91,12 @@ async def search_assets(
             Asset.file_size_bytes,
             Asset.created_at,
             # Search rank
-            func.ts_rank(
-                Asset.search_vector,
-                func.plainto_tsquery("portuguese", q)
-            ).label("rank"),
-            # Headline (highlighted snippet)
-            func.ts_headline(
-                "portuguese",
-                func.coalesce(Asset.title, "") + " " + func.coalesce(Asset.description, ""),
-                func.plainto_tsquery("portuguese", q),
-                "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15"
-            ).label("headline"),
+            func.ts_rank(Asset.search_vector, tsquery.c.query).label("rank"),
         )
+        .join(tsquery, Asset.search_vector.op("@@")(tsquery.c.query))
         .where(
             Asset.tenant_id == tenant.id,
             Asset.deleted_at.is_(None),
-            Asset.search_vector.op("@@")(func.plainto_tsquery("portuguese", q)),
         )
     )
 
@@ -104,23 +116,38 @@ async def search_assets(
     if date_to:
         query = query.where(Asset.created_at <= date_to)
 
-    # Count total
-    count_subquery = query.subquery()
-    count_result = await db.execute(
-        select(func.count()).select_from(count_subquery)
-    )
-    total = count_result.scalar() or 0
-
-    # Paginate and order by rank
+    # Paginate and order by rank, with the total count as a window over all
+    # matches so the page and its total come back in one statement
     offset = (pagination.page - 1) * pagination.page_size
-    query = query.order_by(text("rank DESC")).offset(offset).limit(pagination.page_size)
+    page = (
+        query.add_columns(func.count().over().label("total"))
+        .order_by(text("rank DESC"))
+        .offset(offset)
+        .limit(pagination.page_size)
+        .subquery()
+    )
 
-    result = await db.execute(query)
+    # Headline (highlighted snippet) only for the rows on the page
+    result = await db.execute(
+        select(
+            page,
+            func.ts_headline(
+                "portuguese",
+                func.coalesce(page.c.title, "") + " " + func.coalesce(page.c.description, ""),
+                tsquery.c.query,
+                "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15"
+            ).label("headline"),
+        )
+        .select_from(page)
+        .join(tsquery, true())
+        .order_by(page.c.rank.desc())
+    )
     rows = result.all()
+    total = rows[0].total if rows else await _count_beyond_page(db, query, offset)
 
     # Build response
     results = [
-        SearchResult(
+        SearchResult.model_construct(
             id=row.id,
             title=row.title,
             description=row.description,
@@ -130,7 +157,7 @@ async def search_assets(
             file_size_bytes=row.file_size_bytes,
             thumbnail_url=None,  # TODO: Add thumbnail URL
             created_at=row.created_at,
-            rank=float(row.rank) if row.rank else None,
+            rank=row.rank or None,  # ts_rank is real, already a float from asyncpg
             headline=row.headline,
         )
         for row in rows
@@ -140,14 +167,14 @@ async def search_assets(
 
     logger.info(f"Search '{q}' returned {total} results in {search_time_ms}ms")
 
-    return SearchResponse(
+    return _search_response(SearchResponse.model_construct(
         query=q,
         total=total,
         page=pagination.page,
         page_size=pagination.page_size,
         results=results,
         search_time_ms=search_time_ms,
-    )
+    ))
 
 
 @router.get("/suggestions", response_model=list[SearchSuggestion])
@@ -163,11 +190,14 @@ async def get_search_suggestions(
     """
     tenant = await get_tenant_by_code(db, tenant_code)
 
-    suggestions = []
-
-    # Search in asset titles
+    # Titles and keywords, each served by its trigram index (idx_assets_title_trgm,
+    # idx_keywords_trgm) and capped at half the limit, merged and ranked in one query
     title_query = (
-        select(Asset.title, func.count().label("count"))
+        select(
+            Asset.title.label("text"),
+            literal_column("'title'").label("type"),
+            func.count().label("count"),
+        )
         .where(
             Asset.tenant_id == tenant.id,
             Asset.deleted_at.is_(None),
@@ -177,20 +207,12 @@ async def get_search_suggestions(
         .order_by(text("count DESC"))
         .limit(limit // 2)
     )
-
-    title_result = await db.execute(title_query)
-    for row in title_result.all():
-        suggestions.append(
-            SearchSuggestion(
-                text=row.title,
-                type="title",
-                count=row.count,
-            )
-        )
-
-    # Search in keywords
     keyword_query = (
-        select(AssetKeyword.keyword, func.count().label("count"))
+        select(
+            AssetKeyword.keyword.label("text"),
+            literal_column("'keyword'").label("type"),
+            func.count().label("count"),
+        )
         .where(
             AssetKeyword.tenant_id == tenant.id,
             AssetKeyword.keyword.ilike(f"%{q}%"),
@@ -199,20 +221,16 @@ async def get_search_suggestions(
         .order_by(text("count DESC"))
         .limit(limit // 2)
     )
+    suggestions = union_all(title_query, keyword_query).subquery()
 
-    keyword_result = await db.execute(keyword_query)
-    for row in keyword_result.all():
-        suggestions.append(
-            SearchSuggestion(
-                text=row.keyword,
-                type="keyword",
-                count=row.count,
-            )
-        )
+    result = await db.execute(
+        select(suggestions).order_by(suggestions.c.count.desc()).limit(limit)
+    )
 
-    # Sort by count and limit
-    suggestions.sort(key=lambda x: x.count or 0, reverse=True)
-    return suggestions[:limit]
+    return [
+        SearchSuggestion.model_construct(text=row.text, type=row.type, count=row.count)
+        for row in result.all()
+    ]
 
 
 @router.get("/advanced", response_model=SearchResponse)
@@ -327,29 +345,27 @@ async def advanced_search(
         )
         query = query.where(Asset.id.in_(keyword_subquery))
 
-    # Count total
-    count_subquery = query.subquery()
-    count_result = await db.execute(
-        select(func.count()).select_from(count_subquery)
-    )
-    total = count_result.scalar() or 0
-
     # Sorting
     sort_column = getattr(Asset, sort_by, Asset.created_at)
     if sort_order.lower() == "asc":
-        query = query.order_by(sort_column.asc())
+        page_query = query.order_by(sort_column.asc())
     else:
-        query = query.order_by(sort_column.desc())
+        page_query = query.order_by(sort_column.desc())
 
-    # Paginate
+    # Paginate, with the total count as a window over all matches
     offset = (pagination.page - 1) * pagination.page_size
-    query = query.offset(offset).limit(pagination.page_size)
+    page_query = (
+        page_query.add_columns(func.count().over().label("total"))
+        .offset(offset)
+        .limit(pagination.page_size)
+    )
 
-    result = await db.execute(query)
+    result = await db.execute(page_query)
     rows = result.all()
+    total = rows[0].total if rows else await _count_beyond_page(db, query, offset)
 
     results = [
-        SearchResult(
+        SearchResult.model_construct(
             id=row.id,
             title=row.title,
             description=row.description,
@@ -365,14 +381,14 @@ async def advanced_search(
 
     search_time_ms = int((time.time() - start_time) * 1000)
 
-    return SearchResponse(
+    return _search_response(SearchResponse.model_construct(
         query=q or "",
         total=total,
         page=pagination.page,
         page_size=pagination.page_size,
         results=results,
         search_time_ms=search_time_ms,
-    )
+    ))
 
 
 # ======================
@@ -5,8 +5,10 @@ Transcription API endpoints.
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
-from sqlalchemy import select
+from sqlalchemy import Row, case, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from app.api.deps import get_current_user, get_db, get_tenant_id
 from app.models.asset import Asset
@@ -69,39 +71,55 @@ async def start_transcription(
     """Start transcription of an asset."""
     from app.models.asset_storage import IngestJob
 
-    # Verify asset exists
-    result = await db.execute(
-        select(Asset).where(Asset.id == asset_id)
+    # Create the job only if the asset exists in this tenant and can be transcribed
+    job_id = await db.scalar(
+        insert(IngestJob)
+        .from_select(
+            ["asset_id", "tenant_id", "job_type", "status", "priority", "config"],
+            select(
+                Asset.id,
+                Asset.tenant_id,
+                literal("transcription"),
+                literal("pending"),
+                literal(5),
+                literal(
+                    {
+                        "language": request.language,
+                        "model": request.model,
+                    },
+                    JSONB,
+                ),
+            )
+            .where(
+                Asset.id == asset_id,
+                Asset.tenant_id == tenant_id,
+                Asset.asset_type.in_(("video", "audio")),
+            )
+            .limit(1),
+            include_defaults=False,
+        )
+        .returning(IngestJob.id)
     )
-    asset = result.scalar_one_or_none()
 
-    if not asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asset not found",
+    if job_id is None:
+        # Nothing inserted: tell a missing asset apart from an unsupported type
+        asset_exists = await db.scalar(
+            select(
+                select(Asset.id)
+                .where(Asset.id == asset_id, Asset.tenant_id == tenant_id)
+                .exists()
+            )
         )
-
-    # Check if asset is video or audio
-    if asset.asset_type not in ("video", "audio"):
+        if not asset_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Asset not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Transcription only available for video and audio assets",
         )
 
-    # Create a job for transcription
-    job = IngestJob(
-        asset_id=asset_id,
-        tenant_id=tenant_id,
-        job_type="transcription",
-        status="pending",
-        priority=5,
-        config={
-            "language": request.language,
-            "model": request.model,
-        },
-    )
-    db.add(job)
-    await db.flush()
     await db.commit()
 
     # Queue the Celery task
@@ -115,13 +133,40 @@ async def start_transcription(
     )
 
     return TranscribeResponse(
-        job_id=job.id,
+        job_id=job_id,
         asset_id=asset_id,
         status="pending",
         message=f"Transcription started with model {request.model}",
     )
 
 
+async def _subtitle_row(
+    db: AsyncSession,
+    content_column: InstrumentedAttribute[str | None],
+    asset_id: UUID,
+    tenant_id: UUID,
+    language: str,
+) -> Row | None:
+    """
+    Fetch a stored subtitle file, with `segments` only when it has none.
+
+    Skips transferring the (potentially multi-MB) segments JSONB unless the
+    subtitle has to be rebuilt from it.
+    """
+    result = await db.execute(
+        select(
+            content_column.label("content"),
+            case(
+                (func.nullif(content_column, "").is_(None), AssetTranscription.segments)
+            ).label("segments"),
+        )
+        .where(AssetTranscription.asset_id == asset_id)
+        .where(AssetTranscription.tenant_id == tenant_id)
+        .where(AssetTranscription.language == language)
+    )
+    return result.one_or_none()
+
+
 @router.get("/{asset_id}/subtitles.srt")
 async def get_srt_subtitles(
     asset_id: UUID,
@@ -130,21 +175,17 @@ async def get_srt_subtitles(
     tenant_id: UUID = Depends(get_tenant_id),
 ):
     """Download SRT subtitle file for an asset."""
-    result = await db.execute(
-        select(AssetTranscription)
-        .where(AssetTranscription.asset_id == asset_id)
-        .where(AssetTranscription.tenant_id == tenant_id)
-        .where(AssetTranscription.language == language)
+    row = await _subtitle_row(
+        db, AssetTranscription.srt_content, asset_id, tenant_id, language
     )
-    transcription = result.scalar_one_or_none()
 
-    if not transcription:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transcription not found",
         )
 
-    srt_content = transcription.srt_content or transcription.to_srt()
+    srt_content = row.content or AssetTranscription(segments=row.segments).to_srt()
 
     return Response(
         content=srt_content,
@@ -163,21 +204,17 @@ async def get_vtt_subtitles(
     tenant_id: UUID = Depends(get_tenant_id),
 ):
     """Download WebVTT subtitle file for an asset."""
-    result = await db.execute(
-        select(AssetTranscription)
-        .where(AssetTranscription.asset_id == asset_id)
-        .where(AssetTranscription.tenant_id == tenant_id)
-        .where(AssetTranscription.language == language)
+    row = await _subtitle_row(
+        db, AssetTranscription.vtt_content, asset_id, tenant_id, language
     )
-    transcription = result.scalar_one_or_none()
 
-    if not transcription:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transcription not found",
         )
 
-    vtt_content = transcription.vtt_content or transcription.to_vtt()
+    vtt_content = row.content or AssetTranscription(segments=row.segments).to_vtt()
 
     return Response(
         content=vtt_content,
@@ -0,0 +1,11 @@
+"""
+AKASHI MAM API - Clock Utilities
+"""
+
+import time
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
@@ -2,15 +2,20 @@
 AKASHI MAM API - Database Configuration
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from uuid import uuid4
 
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.core.config import settings
 
@@ -22,14 +27,57 @@ class Base(DeclarativeBase):
 
 
 # Create async engine
+if settings.database_pgbouncer:
+    # PgBouncer does the pooling; a second pool here would pin its server
+    # connections. Statements can't be reused across its server connections,
+    # so disable statement caching and use unique prepared statement names.
+    _pool_options = {"poolclass": NullPool}
+    _connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+else:
+    # LIFO checkout keeps a small set of warm connections busy and lets idle
+    # overflow connections time out instead of being rotated through
+    _pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_use_lifo": settings.database_pool_use_lifo,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    }
+    # asyncpg prepares each statement once per connection and reuses it, so
+    # hot queries (e.g. face search) skip parse/plan after the first call
+    _connect_args = {
+        "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+    }
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,
+    query_cache_size=settings.database_query_cache_size,
+    connect_args=_connect_args,
+    **_pool_options,
 )
 
+
+async def _register_vector_codec(connection) -> None:
+    """Bind pgvector values in binary form (skipped if the extension is missing)."""
+    try:
+        await register_vector(connection)
+    except ValueError:
+        pass
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record) -> None:
+    """Register per-connection type codecs on new asyncpg connections."""
+    dbapi_connection.run_async(_register_vector_codec)
+
+
 # Create async session factory
 async_session_factory = async_sessionmaker(
     engine,
@@ -81,6 +129,25 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_db_pool() -> None:
+    """
+    Open `database_pool_size` connections up front so early requests don't pay
+    connect/auth latency. Connections are held together while warming (so the
+    pool really grows) and then returned to it. No-op behind PgBouncer.
+    """
+    if settings.database_pgbouncer:
+        return
+
+    async def _checkout(stack: AsyncExitStack) -> None:
+        conn = await stack.enter_async_context(engine.connect())
+        await conn.execute(text("SELECT 1"))
+
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(
+            *(_checkout(stack) for _ in range(settings.database_pool_size))
+        )
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
@@ -0,0 +1,67 @@
+"""
+AKASHI MAM API - Inference Process Pool
+Runs CPU-bound model inference outside the event loop's process.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_inference_pool: ProcessPoolExecutor | None = None
+
+
+def _init_worker() -> None:
+    """Keep each worker's model to one CPU thread; parallelism comes from the pool."""
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+
+def get_inference_pool() -> ProcessPoolExecutor:
+    """Lazily start the process pool used for request-time inference."""
+    global _inference_pool
+    if _inference_pool is None:
+        # spawn: don't fork the server's event loop and open connections
+        _inference_pool = ProcessPoolExecutor(
+            max_workers=settings.inference_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _inference_pool
+
+
+async def run_inference(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Run `fn(*args)` in the inference pool.
+
+    A worker that dies (e.g. OOM-killed) breaks the whole executor, so the
+    broken pool is shut down and the next call starts a fresh one. The call
+    that hit the failure still raises.
+    """
+    global _inference_pool
+    pool = get_inference_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        logger.error("Inference pool broken (worker process died); restarting it")
+        if _inference_pool is pool:
+            _inference_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def shutdown_inference_pool() -> None:
+    """Stop the inference worker processes (call on application shutdown)."""
+    global _inference_pool
+    if _inference_pool is not None:
+        _inference_pool.shutdown(wait=False, cancel_futures=True)
+        _inference_pool = None
@@ -0,0 +1,79 @@
+"""
+AKASHI MAM API - Refresh Token Cache
+Redis cache-aside layer for refresh token lookups by hash.
+"""
+
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from app.core.rate_limit import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "rt"
+
+
+def _key(token_hash: str) -> str:
+    return f"{KEY_PREFIX}:{token_hash}"
+
+
+async def get_cached_refresh_token(token_hash: str) -> dict[str, Any] | None:
+    """
+    Get a cached refresh token record.
+
+    Returns:
+        Dict with id, user_id, expires_at and is_revoked, or None on miss/error
+    """
+    try:
+        raw = await (await get_redis()).get(_key(token_hash))
+    except Exception as e:
+        logger.warning(f"Refresh token cache read error: {e}")
+        return None
+
+    if raw is None:
+        return None
+
+    data = json.loads(raw)
+    return {
+        "id": UUID(data["id"]),
+        "user_id": UUID(data["user_id"]),
+        "expires_at": datetime.fromisoformat(data["expires_at"]),
+        "is_revoked": data["is_revoked"],
+    }
+
+
+async def cache_refresh_token(
+    token_hash: str,
+    token_id: UUID,
+    user_id: UUID,
+    expires_at: datetime,
+    is_revoked: bool,
+) -> None:
+    """Cache a refresh token record until the token itself expires."""
+    ttl = int((expires_at - datetime.now(timezone.utc)).total_seconds())
+    if ttl <= 0:
+        return
+
+    value = json.dumps({
+        "id": str(token_id),
+        "user_id": str(user_id),
+        "expires_at": expires_at.isoformat(),
+        "is_revoked": is_revoked,
+    })
+    try:
+        await (await get_redis()).setex(_key(token_hash), ttl, value)
+    except Exception as e:
+        logger.warning(f"Refresh token cache write error: {e}")
+
+
+async def invalidate_refresh_tokens(*token_hashes: str) -> None:
+    """Drop refresh tokens from the cache. Call after the revoking commit."""
+    if not token_hashes:
+        return
+    try:
+        await (await get_redis()).delete(*(_key(h) for h in token_hashes))
+    except Exception as e:
+        logger.warning(f"Refresh token cache delete error: {e}")
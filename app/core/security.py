@@ -4,12 +4,16 @@ JWT token handling, password hashing, and refresh tokens.
 """
 
 import hashlib
+import hmac
+import re
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import bcrypt
-from jose import JWTError, jwt
+from cachetools import TTLCache
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
 from app.core.config import settings
 
@@ -19,6 +23,15 @@ from app.core.config import settings
 # =============================================================================
 
 
+# Recent successful verifications, keyed by an HMAC of (hash, password) so
+# neither is held in memory. The stored hash is part of the key, so a password
+# change makes old entries unreachable.
+PASSWORD_VERIFY_CACHE_TTL_SECONDS = 60
+_password_verify_cache: TTLCache = TTLCache(
+    maxsize=10_000, ttl=PASSWORD_VERIFY_CACHE_TTL_SECONDS
+)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
@@ -29,10 +42,26 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     Returns:
         True if password matches, False otherwise
+
+    Note:
+        Successful results are cached briefly so client retries skip bcrypt.
+        Failures are never cached.
     """
     password_bytes = plain_password.encode("utf-8")[:72]
     hashed_bytes = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+    cache_key = hmac.new(
+        settings.secret_key.encode("utf-8"),
+        hashed_bytes + b"\0" + password_bytes,
+        hashlib.sha256,
+    ).digest()
+    if cache_key in _password_verify_cache:
+        return True
+
+    if not bcrypt.checkpw(password_bytes, hashed_bytes):
+        return False
+    _password_verify_cache[cache_key] = True
+    return True
 
 
 def get_password_hash(password: str) -> str:
@@ -106,6 +135,12 @@ def create_access_token(
     return encoded_jwt
 
 
+# Verification key for the configured secret, built once. Every token is signed
+# with it, so the (unverified) `kid` header is never used to pick or cache keys.
+# Passing a ready Key to jose skips its per-call key parsing and construction.
+_verification_key: Key = jwk.construct(settings.jwt_secret_key, settings.jwt_algorithm)
+
+
 def decode_access_token(token: str) -> dict[str, Any] | None:
     """
     Decode and validate a JWT access token.
@@ -117,9 +152,13 @@ def decode_access_token(token: str) -> dict[str, Any] | None:
         The decoded token payload, or None if invalid
     """
     try:
+        header = jwt.get_unverified_header(token)
+        if header.get("alg") != settings.jwt_algorithm:
+            return None
+
         payload = jwt.decode(
             token,
-            settings.jwt_secret_key,
+            _verification_key,
             algorithms=[settings.jwt_algorithm],
         )
         # Verify token type if present
@@ -155,6 +194,20 @@ def generate_refresh_token() -> str:
     return secrets.token_urlsafe(48)  # 64 chars base64
 
 
+# token_urlsafe(48) always yields 64 URL-safe base64 characters
+_REFRESH_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_-]{64}")
+
+
+def is_well_formed_refresh_token(token: str) -> bool:
+    """
+    Check that a refresh token has the shape `generate_refresh_token` produces.
+
+    Refresh tokens are opaque, so this is the only check possible without a
+    lookup; it lets malformed input be rejected with no cache/database I/O.
+    """
+    return _REFRESH_TOKEN_PATTERN.fullmatch(token) is not None
+
+
 def hash_refresh_token(token: str) -> str:
     """
     Hash a refresh token for storage.
@@ -168,6 +221,37 @@ def hash_refresh_token(token: str) -> str:
     return hashlib.sha256(token.encode()).hexdigest()
 
 
+# Hex characters of the token hash kept in the indexed lookup column (8 bytes)
+REFRESH_TOKEN_HASH_PREFIX_LENGTH = 16
+
+
+def refresh_token_hash_prefix(token_hash: str) -> str:
+    """
+    Get the lookup prefix of a refresh token hash.
+
+    Rows are located by this prefix and the full hash is then compared with
+    `hmac.compare_digest`, so the full hash is never compared by the database.
+    """
+    return token_hash[:REFRESH_TOKEN_HASH_PREFIX_LENGTH]
+
+
+def find_refresh_token_match(rows: Any, token_hash: str) -> Any | None:
+    """
+    Pick the row whose `token_hash` matches, comparing in constant time.
+
+    Args:
+        rows: Candidate rows fetched by hash prefix
+        token_hash: Full hash of the presented token
+
+    Returns:
+        The matching row, or None
+    """
+    return next(
+        (row for row in rows if hmac.compare_digest(row.token_hash, token_hash)),
+        None,
+    )
+
+
 def get_refresh_token_expiration() -> datetime:
     """
     Get the expiration datetime for a new refresh token.
@@ -12,7 +12,8 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.config import settings
-from app.core.database import close_db
+from app.core.database import close_db, warm_db_pool
+from app.core.inference_pool import shutdown_inference_pool
 from app.core.rate_limit import close_redis, rate_limit_middleware
 from app.api.v1.router import api_router
 
@@ -25,9 +26,15 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     logger.info("Starting AKASHI MAM API...")
+    if settings.database_pool_warmup:
+        try:
+            await warm_db_pool()
+        except Exception as e:
+            logger.warning(f"Database pool warm-up failed: {e}")
     yield
     # Shutdown
     logger.info("Shutting down AKASHI MAM API...")
+    shutdown_inference_pool()
     await close_db()
     await close_redis()
 
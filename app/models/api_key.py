@@ -1,14 +1,16 @@
 """API Key model for external integrations and MCP server."""
 
 import hashlib
+import hmac
 import secrets
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.core.config import settings
 from app.core.database import Base
 
 
@@ -16,6 +18,21 @@ class APIKey(Base):
     """Model for storing API keys for external access."""
 
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Covers list_api_keys (filter + ORDER BY created_at DESC) without a sort
+        Index(
+            "idx_api_keys_user_tenant_created",
+            "user_id",
+            "tenant_id",
+            text("created_at DESC"),
+        ),
+        Index(
+            "idx_api_keys_tenant_prefix_active",
+            "tenant_id",
+            "key_prefix",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -71,7 +88,7 @@ class APIKey(Base):
         full_key = f"ak_{random_part}"
 
         # Hash for storage
-        key_hash = hashlib.sha256(full_key.encode()).hexdigest()
+        key_hash = APIKey.hash_key(full_key)
 
         # Prefix for identification (first 8 chars after ak_)
         key_prefix = f"ak_{random_part[:4]}"
@@ -80,8 +97,32 @@ class APIKey(Base):
 
     @staticmethod
     def hash_key(key: str) -> str:
-        """Hash an API key for lookup."""
-        return hashlib.sha256(key.encode()).hexdigest()
+        """
+        Hash an API key for lookup.
+
+        Keys are high-entropy random strings, so a peppered HMAC-SHA256 is
+        sufficient (no slow KDF needed) and keeps verification sub-microsecond.
+        """
+        return hmac.new(
+            settings.api_key_pepper.encode(), key.encode(), hashlib.sha256
+        ).hexdigest()
+
+    def verify_key(self, key: str) -> bool:
+        """
+        Check a presented key against this record in constant time.
+
+        Keys issued before the pepper was introduced are stored as a bare
+        SHA-256 digest. On their first successful check key_hash is rewritten
+        to the peppered form; the caller's commit persists it.
+        """
+        key_hash = self.hash_key(key)
+        if hmac.compare_digest(key_hash, self.key_hash):
+            return True
+        legacy_hash = hashlib.sha256(key.encode()).hexdigest()
+        if hmac.compare_digest(legacy_hash, self.key_hash):
+            self.key_hash = key_hash
+            return True
+        return False
 
     def has_scope(self, scope: str) -> bool:
         """Check if this key has a specific scope."""
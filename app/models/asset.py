@@ -27,9 +27,12 @@ class Asset(Base, TimestampMixin, SoftDeleteMixin, ExtraMixin):
     """
 
     __tablename__ = "assets"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         Index("idx_assets_tenant_status", "tenant_id", "status"),
         Index("idx_assets_tenant_type", "tenant_id", "asset_type"),
+        # Index-only title lookups by id (face search results)
+        Index("idx_assets_id_title", "id", postgresql_include=["title"]),
         {"postgresql_partition_by": "RANGE (partition_date)"},
     )
 
@@ -25,6 +25,7 @@ class Collection(Base):
     """Collection model for grouping assets."""
 
     __tablename__ = "collections"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
@@ -106,6 +107,7 @@ class CollectionItem(Base):
     """Collection item linking assets to collections."""
 
     __tablename__ = "collection_items"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
@@ -144,6 +146,13 @@ class CollectionItem(Base):
         "Collection",
         back_populates="items",
     )
+    # Note: primaryjoin with foreign() because assets is a partitioned table
+    # without formal FKs from related tables
+    asset: Mapped["Asset | None"] = relationship(
+        "Asset",
+        primaryjoin="foreign(CollectionItem.asset_id) == Asset.id",
+        viewonly=True,
+    )
 
     def __repr__(self) -> str:
         return f"<CollectionItem collection={self.collection_id} asset={self.asset_id}>"
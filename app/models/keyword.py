@@ -27,6 +27,14 @@ class AssetKeyword(Base):
     __table_args__ = (
         Index("idx_keywords_asset", "asset_id"),
         Index("idx_keywords_search", "tenant_id", "keyword_normalized"),
+        Index(
+            "uq_keywords_asset_keyword_start",
+            "asset_id",
+            "keyword",
+            "start_ms",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
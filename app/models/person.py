@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +17,10 @@ class Person(Base):
     """Model for storing known people for face recognition."""
 
     __tablename__ = "persons"
+    __table_args__ = (
+        # Keyset pagination in list_persons: ORDER BY name, id within a tenant
+        Index("idx_persons_tenant_name_id", "tenant_id", "name", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -74,6 +78,10 @@ class AssetFace(Base):
     """Model for storing detected faces in assets."""
 
     __tablename__ = "asset_faces"
+    __table_args__ = (
+        # list_asset_faces: filter by tenant + asset, ordered by timecode
+        Index("idx_faces_tenant_asset_timecode", "tenant_id", "asset_id", "timecode_ms"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -105,8 +113,9 @@ class AssetFace(Base):
     bbox_w: Mapped[float | None] = mapped_column(nullable=True)
     bbox_h: Mapped[float | None] = mapped_column(nullable=True)
 
-    # Face embedding is stored as vector(512) in DB
-    # We don't map it directly, use raw SQL for vector operations
+    # Face embedding is stored as vector(512) in DB, plus a generated
+    # halfvec(512) copy (face_embedding_half) used for similarity search.
+    # We don't map them directly, use raw SQL for vector operations
 
     # Thumbnail
     thumbnail_url: Mapped[str | None] = mapped_column(Text, nullable=True)
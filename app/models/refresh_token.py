@@ -31,6 +31,11 @@ class RefreshToken(Base):
         unique=True,
         index=True,
     )
+    token_hash_prefix: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        index=True,
+    )
 
     # Token metadata
     device_info: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import BigInteger, DateTime, String, Text, func
+from sqlalchemy import BigInteger, DateTime, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -15,6 +15,15 @@ class AssetSceneDescription(Base):
     """Model for storing AI-generated scene descriptions."""
 
     __tablename__ = "asset_scene_descriptions"
+    __table_args__ = (
+        # Scene listing and timeline: filter by tenant + asset, ordered by start
+        Index(
+            "idx_scenes_tenant_asset_timecode",
+            "tenant_id",
+            "asset_id",
+            "timecode_start_ms",
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
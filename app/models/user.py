@@ -22,6 +22,9 @@ class User(Base):
     """User account model."""
 
     __tablename__ = "users"
+    # Fetch server-generated columns (id, timestamps) via RETURNING on flush,
+    # so callers don't need a follow-up refresh() SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
@@ -2,7 +2,7 @@
 AKASHI MAM API - Common Schemas
 """
 
-from typing import Generic, TypeVar
+from typing import Any, Generic, Self, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -20,6 +20,16 @@ class BaseSchema(BaseModel):
         str_strip_whitespace=True,
     )
 
+    @classmethod
+    def from_orm_unsafe(cls, obj: Any) -> Self:
+        """
+        Build from a trusted ORM object without running validation.
+
+        Only for flat schemas whose fields are plain column attributes of `obj`;
+        nested schema fields would be left as raw values.
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
+
 
 class PaginationParams(BaseModel):
     """Pagination parameters for list endpoints."""
@@ -16,10 +16,25 @@ from uuid import UUID
 import numpy as np
 
 from app.core.config import settings
+from app.core.inference_pool import run_inference
 
 logger = logging.getLogger(__name__)
 
 
+def normalize_embedding(embedding: list[float]) -> list[float]:
+    """
+    Scale an embedding to unit L2 norm.
+
+    Stored and query embeddings are unit-length, so the database can rank by
+    inner product (`<#>`), which equals cosine similarity for unit vectors.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return vector.tolist()
+    return (vector / norm).tolist()
+
+
 class FaceDetection:
     """A detected face with bounding box and embedding."""
 
@@ -175,6 +190,14 @@ class FaceService:
         timecode_ms: int | None = None,
     ) -> list[FaceDetection]:
         """Detect faces in a single frame."""
+        return self._detect_faces_in_frame_sync(frame, timecode_ms)
+
+    def _detect_faces_in_frame_sync(
+        self,
+        frame: np.ndarray,
+        timecode_ms: int | None = None,
+    ) -> list[FaceDetection]:
+        """Detect faces in a single frame (blocking; runs the model inline)."""
         import cv2
 
         model = self._get_model()
@@ -210,7 +233,7 @@ class FaceService:
 
                         faces.append(FaceDetection(
                             bbox=bbox,
-                            embedding=result.get("embedding", []),
+                            embedding=normalize_embedding(result.get("embedding", [])),
                             confidence=result.get("face_confidence", 0.9),
                             timecode_ms=timecode_ms,
                             thumbnail=thumb_bytes.tobytes(),
@@ -243,7 +266,7 @@ class FaceService:
 
                 faces.append(FaceDetection(
                     bbox=bbox,
-                    embedding=face.embedding.tolist(),
+                    embedding=normalize_embedding(face.embedding),
                     confidence=float(face.det_score),
                     timecode_ms=timecode_ms,
                     thumbnail=thumb_bytes.tobytes(),
@@ -258,14 +281,23 @@ class FaceService:
         """
         Get face embedding from an image.
 
+        Decoding and inference run in the inference process pool so the
+        event loop stays free for other requests.
+
         Args:
             image_data: Image bytes or base64 string
 
         Returns:
-            Face embedding vector (512 dimensions)
+            Unit-length face embedding vector (512 dimensions)
         """
+        return await run_inference(_embedding_from_image, image_data)
+
+    def get_embedding_from_image_sync(
+        self,
+        image_data: bytes | str,
+    ) -> list[float]:
+        """Blocking version of get_embedding_from_image (runs in the caller)."""
         import cv2
-        import numpy as np
 
         # Decode base64 if needed
         if isinstance(image_data, str):
@@ -279,7 +311,7 @@ class FaceService:
             raise ValueError("Could not decode image")
 
         # Detect faces
-        faces = await self._detect_faces_in_frame(image)
+        faces = self._detect_faces_in_frame_sync(image)
 
         if not faces:
             raise ValueError("No face detected in image")
@@ -360,3 +392,8 @@ class FaceService:
 
 # Singleton instance
 face_service = FaceService()
+
+
+def _embedding_from_image(image_data: bytes | str) -> list[float]:
+    """Pool task: uses the worker process's own face_service (model loads once)."""
+    return face_service.get_embedding_from_image_sync(image_data)
@@ -390,7 +390,6 @@ class SearchService:
 
         try:
             # Get embedding from uploaded image
-            import asyncio
             embedding = await face_service.get_embedding_from_image(face_image)
 
             sql = """
@@ -404,19 +403,19 @@ class SearchService:
                     f.timecode_ms,
                     f.person_id,
                     p.name as person_name,
-                    1 - (f.face_embedding <=> :embedding::vector) as similarity
+                    -(f.face_embedding_half <#> CAST(:embedding AS halfvec)) as similarity
                 FROM asset_faces f
                 JOIN assets a ON a.id = f.asset_id
                 LEFT JOIN persons p ON p.id = f.person_id
                 WHERE f.tenant_id = :tenant_id
-                AND f.face_embedding IS NOT NULL
-                ORDER BY f.face_embedding <=> :embedding::vector
+                AND f.face_embedding_half IS NOT NULL
+                ORDER BY f.face_embedding_half <#> CAST(:embedding AS halfvec)
                 LIMIT 50
             """
 
             params = {
                 "tenant_id": tenant_id,
-                "embedding": str(embedding),
+                "embedding": embedding,
             }
 
             result = await db.execute(text(sql), params)
@@ -2,6 +2,8 @@
 AKASHI MAM API - Storage Service (MinIO/S3)
 """
 
+import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import BinaryIO
 from uuid import uuid4
@@ -9,9 +11,23 @@ from uuid import uuid4
 import boto3
 from botocore.config import Config
 from botocore.exceptions import ClientError
+from cachetools import TLRUCache
 
 from app.core.config import settings
 
+# Longest a generated presigned URL is reused
+PRESIGNED_URL_CACHE_TTL_SECONDS = 1800
+
+
+def _presigned_ttu(key: tuple, _url: str, now: float) -> float:
+    """Reuse a URL for at most half its lifetime, so callers always get >= half."""
+    expires_in = key[3]
+    return now + min(PRESIGNED_URL_CACHE_TTL_SECONDS, expires_in // 2)
+
+
+# Presigned URLs keyed by (method, bucket, path, expires_in), shared by all instances
+_presigned_cache: TLRUCache = TLRUCache(maxsize=10000, ttu=_presigned_ttu, timer=time.time)
+
 
 class StorageService:
     """Service for interacting with MinIO/S3 object storage."""
@@ -65,17 +81,22 @@ class StorageService:
 
     async def upload_file(
         self,
-        content: bytes,
+        content: bytes | None = None,
+        *,
         filename: str,
         asset_id: str,
         tenant_code: str,
         purpose: str = "original",
         bucket: str | None = None,
         content_type: str | None = None,
+        file_obj: BinaryIO | None = None,
     ) -> str:
         """
         Upload a file to storage.
 
+        Pass either `content` or `file_obj`; a file object is streamed in
+        multipart chunks instead of being held in memory.
+
         Args:
             content: File content as bytes
             filename: Original filename
@@ -84,10 +105,14 @@ class StorageService:
             purpose: File purpose (original, proxy, thumbnail)
             bucket: Override bucket name
             content_type: MIME type
+            file_obj: Binary file object to stream instead of `content`
 
         Returns:
             Storage path (without bucket name)
         """
+        if (content is None) == (file_obj is None):
+            raise ValueError("Pass exactly one of content or file_obj")
+
         if bucket is None:
             bucket = {
                 "original": self.bucket_originals,
@@ -101,12 +126,23 @@ class StorageService:
         if content_type:
             extra_args["ContentType"] = content_type
 
-        self._client.put_object(
-            Bucket=bucket,
-            Key=path,
-            Body=content,
-            **extra_args,
-        )
+        if file_obj is not None:
+            # A file object may be a pipe that fills as its producer runs, so
+            # keep the multipart upload off the event loop
+            await asyncio.to_thread(
+                self._client.upload_fileobj,
+                file_obj,
+                bucket,
+                path,
+                ExtraArgs=extra_args or None,
+            )
+        else:
+            self._client.put_object(
+                Bucket=bucket,
+                Key=path,
+                Body=content,
+                **extra_args,
+            )
 
         return path
 
@@ -157,11 +193,16 @@ class StorageService:
         Returns:
             Presigned URL
         """
-        return self._client.generate_presigned_url(
-            method,
-            Params={"Bucket": bucket, "Key": path},
-            ExpiresIn=expires_in,
-        )
+        key = (method, bucket, path, expires_in)
+        url = _presigned_cache.get(key)
+        if url is None:
+            url = self._client.generate_presigned_url(
+                method,
+                Params={"Bucket": bucket, "Key": path},
+                ExpiresIn=expires_in,
+            )
+            _presigned_cache[key] = url
+        return url
 
     async def delete_file(self, bucket: str, path: str) -> None:
         """Delete a file from storage."""
@@ -141,7 +141,7 @@ def detect_faces(
                         VALUES
                         (:asset_id, :tenant_id, :timecode_ms, :duration_ms,
                          :bbox_x, :bbox_y, :bbox_w, :bbox_h,
-                         :embedding::vector, :thumbnail_url, :confidence)
+                         CAST(:embedding AS vector), :thumbnail_url, :confidence)
                     """),
                     {
                         "asset_id": asset_uuid,
@@ -383,7 +383,7 @@ def update_person_embedding(person_id: str) -> dict:
             db.execute(
                 text("""
                     UPDATE persons
-                    SET reference_embedding = :embedding::vector,
+                    SET reference_embedding = CAST(:embedding AS vector),
                         updated_at = NOW()
                     WHERE id = :person_id
                 """),
@@ -0,0 +1,16 @@
+-- Migration: 005_api_key_indexes
+-- AKASHI MAM API - Composite indexes for API key listing and prefix lookup
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- API Keys
+-- =============================================================================
+
+-- list_api_keys: WHERE user_id = ? AND tenant_id = ? ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS idx_api_keys_user_tenant_created
+    ON api_keys(user_id, tenant_id, created_at DESC);
+
+-- Lookup of active keys by prefix within a tenant
+CREATE INDEX IF NOT EXISTS idx_api_keys_tenant_prefix_active
+    ON api_keys(tenant_id, key_prefix)
+    WHERE is_active;
@@ -0,0 +1,15 @@
+-- Migration: 006_assets_title_trgm
+-- AKASHI MAM API - Trigram index for asset title substring search
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Assets title search
+-- =============================================================================
+
+-- Same definition as init-db.sql; ensures databases built only from the
+-- migrations can serve `title ILIKE '%term%'` from an index instead of a
+-- sequential scan.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_assets_title_trgm
+    ON assets USING gin (title gin_trgm_ops);
@@ -0,0 +1,22 @@
+-- Migration: 007_refresh_token_hash_prefix
+-- AKASHI MAM API - Prefix column for constant-time refresh token lookup
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Refresh Tokens
+-- =============================================================================
+
+-- Tokens are located by the first 8 bytes (16 hex chars) of their hash and the
+-- full hash is compared in the application with hmac.compare_digest.
+ALTER TABLE refresh_tokens ADD COLUMN IF NOT EXISTS token_hash_prefix VARCHAR(16);
+
+UPDATE refresh_tokens
+SET token_hash_prefix = LEFT(token_hash, 16)
+WHERE token_hash_prefix IS NULL;
+
+ALTER TABLE refresh_tokens ALTER COLUMN token_hash_prefix SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_refresh_tokens_token_hash_prefix
+    ON refresh_tokens(token_hash_prefix);
+
+COMMENT ON COLUMN refresh_tokens.token_hash_prefix IS 'First 16 hex chars of token_hash, used for lookup';
@@ -0,0 +1,17 @@
+-- Migration: 008_faces_embedding_hnsw
+-- AKASHI MAM API - HNSW index for face similarity search
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Asset faces
+-- =============================================================================
+
+-- Replaces the ivfflat index from 004. ivfflat was built before any faces
+-- existed, so its lists are empty centroids and recall collapses; HNSW needs
+-- no training and keeps `ORDER BY face_embedding <=> ... LIMIT n` an index scan.
+-- Query-time recall is tuned with `hnsw.ef_search` (set per statement by the API).
+DROP INDEX IF EXISTS idx_faces_embedding;
+
+CREATE INDEX IF NOT EXISTS idx_faces_embedding_hnsw
+    ON asset_faces USING hnsw (face_embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
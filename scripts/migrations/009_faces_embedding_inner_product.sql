@@ -0,0 +1,21 @@
+-- Migration: 009_faces_embedding_inner_product
+-- AKASHI MAM API - Unit-length face embeddings ranked by inner product
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Asset faces
+-- =============================================================================
+
+-- Face embeddings are now L2-normalized when written, so cosine similarity
+-- equals the inner product and searches use `<#>` (no per-row norms).
+-- Normalize rows stored before that change (requires pgvector >= 0.7).
+UPDATE asset_faces
+SET face_embedding = l2_normalize(face_embedding)
+WHERE face_embedding IS NOT NULL;
+
+-- Rebuild the HNSW index from 008 with the inner-product operator class
+DROP INDEX IF EXISTS idx_faces_embedding_hnsw;
+
+CREATE INDEX IF NOT EXISTS idx_faces_embedding_hnsw
+    ON asset_faces USING hnsw (face_embedding vector_ip_ops)
+    WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,11 @@
+-- Migration: 010_persons_name_keyset
+-- AKASHI MAM API - Composite index for keyset pagination of persons
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Persons
+-- =============================================================================
+
+-- list_persons: WHERE tenant_id = ? AND (name, id) > (?, ?) ORDER BY name, id
+CREATE INDEX IF NOT EXISTS idx_persons_tenant_name_id
+    ON persons(tenant_id, name, id);
@@ -0,0 +1,22 @@
+-- Migration: 011_faces_embedding_halfvec
+-- AKASHI MAM API - Half-precision copy of face embeddings for search
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Asset faces
+-- =============================================================================
+
+-- Similarity search reads FP16 vectors (1 KB instead of 2 KB per face), which
+-- halves the memory traffic of HNSW traversal. The column is generated from
+-- face_embedding, so writers keep inserting full-precision vectors only.
+-- Requires pgvector >= 0.7 (halfvec).
+ALTER TABLE asset_faces
+    ADD COLUMN IF NOT EXISTS face_embedding_half halfvec(512)
+    GENERATED ALWAYS AS (face_embedding::halfvec(512)) STORED;
+
+-- Search moves to the halfvec index; the FP32 index from 009 is no longer used
+DROP INDEX IF EXISTS idx_faces_embedding_hnsw;
+
+CREATE INDEX IF NOT EXISTS idx_faces_embedding_half_hnsw
+    ON asset_faces USING hnsw (face_embedding_half halfvec_ip_ops)
+    WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,11 @@
+-- Migration: 012_faces_asset_timecode
+-- AKASHI MAM API - Composite index for listing an asset's faces
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Asset faces
+-- =============================================================================
+
+-- list_asset_faces: WHERE tenant_id = ? AND asset_id = ? ORDER BY timecode_ms
+CREATE INDEX IF NOT EXISTS idx_faces_tenant_asset_timecode
+    ON asset_faces(tenant_id, asset_id, timecode_ms);
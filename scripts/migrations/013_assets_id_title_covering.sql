@@ -0,0 +1,14 @@
+-- Migration: 013_assets_id_title_covering
+-- AKASHI MAM API - Covering index for asset title lookups by id
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Assets
+-- =============================================================================
+
+-- Face search joins assets only to read the title of each returned face.
+-- With title included, each probe can be answered by an index-only scan
+-- instead of a heap fetch of the (wide) asset row. Created on the
+-- partitioned table, so every partition gets its own copy.
+CREATE INDEX IF NOT EXISTS idx_assets_id_title
+    ON assets(id) INCLUDE (title);
@@ -0,0 +1,14 @@
+-- Migration: 014_persons_name_trgm
+-- AKASHI MAM API - Trigram index for person name substring search
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Persons
+-- =============================================================================
+
+-- list_persons filters with `name ILIKE '%term%'`; a leading wildcard can't
+-- use a B-tree, so without this every search scans the tenant's persons.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_persons_name_trgm
+    ON persons USING gin (name gin_trgm_ops);
@@ -0,0 +1,27 @@
+-- Migration: 015_keywords_unique_nulls_not_distinct
+-- AKASHI MAM API - Treat untimed keywords as duplicates in the unique key
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Asset keywords
+-- =============================================================================
+
+-- create_keyword inserts with ON CONFLICT (asset_id, keyword, start_ms) DO NOTHING.
+-- The original UNIQUE constraint treats NULL start_ms values as distinct, so
+-- it would let untimed duplicates through; NULLS NOT DISTINCT (PG15+) keeps
+-- the behaviour of the old SELECT-based duplicate check.
+
+-- Drop untimed duplicates that slipped past the API, keeping the oldest
+DELETE FROM asset_keywords k
+USING asset_keywords older
+WHERE k.start_ms IS NULL
+  AND older.start_ms IS NULL
+  AND older.asset_id = k.asset_id
+  AND older.keyword = k.keyword
+  AND (older.created_at, older.id) < (k.created_at, k.id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_keywords_asset_keyword_start
+    ON asset_keywords(asset_id, keyword, start_ms) NULLS NOT DISTINCT;
+
+ALTER TABLE asset_keywords
+    DROP CONSTRAINT IF EXISTS asset_keywords_asset_id_keyword_start_ms_key;
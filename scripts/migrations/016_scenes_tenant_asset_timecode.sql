@@ -0,0 +1,12 @@
+-- Migration: 016_scenes_tenant_asset_timecode
+-- AKASHI MAM API - Composite index for an asset's scene timeline
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Asset scene descriptions
+-- =============================================================================
+
+-- list_asset_scenes / get_asset_timeline: WHERE tenant_id = ? AND asset_id = ?
+-- ORDER BY timecode_start_ms (faces are covered by idx_faces_tenant_asset_timecode)
+CREATE INDEX IF NOT EXISTS idx_scenes_tenant_asset_timecode
+    ON asset_scene_descriptions(tenant_id, asset_id, timecode_start_ms);
@@ -0,0 +1,15 @@
+-- Migration: 017_keywords_trgm
+-- AKASHI MAM API - Trigram index for keyword substring search
+-- Date: 2026-10-15
+
+-- =============================================================================
+-- Asset keywords search
+-- =============================================================================
+
+-- Same definition as init-db.sql; lets the suggestions endpoint serve
+-- `keyword ILIKE '%term%'` from an index on databases built only from the
+-- migrations (titles are covered by 006_assets_title_trgm).
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_keywords_trgm
+    ON asset_keywords USING gin (keyword gin_trgm_ops);
@@ -83,3 +83,21 @@ def test_get_existing_asset():
         assert "title" in asset
         assert "status" in asset
         assert "storage_locations" in asset
+
+
+@pytest.mark.integration
+def test_list_assets_past_last_page():
+    """Test that a page past the end returns no items but still the total."""
+    response = httpx.get(f"{BASE_URL}/api/v1/assets?page_size=100", timeout=10)
+    assert response.status_code == 200
+    total = response.json()["total"]
+
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/assets?page_size=100&page={total // 100 + 2}",
+        timeout=10
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == total
@@ -249,3 +249,21 @@ def test_collection_item_count(auth_token, test_asset_id):
         timeout=10
     )
     assert get_response.json()["item_count"] == 1
+
+
+@pytest.mark.integration
+def test_list_collections_past_last_page():
+    """Test that a page past the end returns no items but still the total."""
+    response = httpx.get(f"{BASE_URL}/api/v1/collections?page_size=100", timeout=10)
+    assert response.status_code == 200
+    total = response.json()["total"]
+
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/collections?page_size=100&page={total // 100 + 2}",
+        timeout=10
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == total
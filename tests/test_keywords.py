@@ -3,6 +3,8 @@ AKASHI MAM - Keywords API Tests
 Integration tests using httpx (synchronous).
 """
 
+import uuid
+
 import pytest
 import httpx
 
@@ -141,3 +143,142 @@ def test_asset_response_includes_keywords(test_asset_id):
     data = response.json()
     assert "keywords" in data
     assert isinstance(data["keywords"], list)
+
+
+@pytest.mark.integration
+def test_create_duplicate_keyword_without_start(test_asset_id):
+    """Test that a repeated keyword with no start_ms is rejected (NULLS NOT DISTINCT)."""
+    keyword_data = {"keyword": f"untimed_{uuid.uuid4().hex[:8]}", "source": "manual"}
+
+    response = httpx.post(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords",
+        json=keyword_data,
+        timeout=10
+    )
+    assert response.status_code == 201
+    keyword_id = response.json()["id"]
+    assert response.json()["start_ms"] is None
+
+    try:
+        response = httpx.post(
+            f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords",
+            json=keyword_data,
+            timeout=10
+        )
+        assert response.status_code == 400
+    finally:
+        httpx.delete(f"{BASE_URL}/api/v1/keywords/{keyword_id}", timeout=10)
+
+
+@pytest.mark.integration
+def test_create_duplicate_keyword_with_start(test_asset_id):
+    """Test that the same keyword at the same start_ms is rejected."""
+    keyword_data = {
+        "keyword": f"timed_{uuid.uuid4().hex[:8]}",
+        "start_ms": 1000,
+        "source": "manual",
+    }
+
+    response = httpx.post(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords",
+        json=keyword_data,
+        timeout=10
+    )
+    assert response.status_code == 201
+    keyword_ids = [response.json()["id"]]
+
+    try:
+        response = httpx.post(
+            f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords",
+            json=keyword_data,
+            timeout=10
+        )
+        assert response.status_code == 400
+
+        # A different start time is a separate occurrence
+        response = httpx.post(
+            f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords",
+            json={**keyword_data, "start_ms": 2000},
+            timeout=10
+        )
+        assert response.status_code == 201
+        keyword_ids.append(response.json()["id"])
+    finally:
+        for keyword_id in keyword_ids:
+            httpx.delete(f"{BASE_URL}/api/v1/keywords/{keyword_id}", timeout=10)
+
+
+@pytest.mark.integration
+def test_list_asset_keywords_total_matches_across_pages(test_asset_id):
+    """Test that every page reports the full total, not the page size."""
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords?limit=500",
+        timeout=10
+    )
+    assert response.status_code == 200
+    total = response.json()["total"]
+    assert total == len(response.json()["items"])
+
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords?limit=1",
+        timeout=10
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == total
+    assert len(response.json()["items"]) == min(total, 1)
+
+
+@pytest.mark.integration
+def test_list_asset_keywords_past_last_page(test_asset_id):
+    """Test that paging past the end returns no items but still the total."""
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords",
+        timeout=10
+    )
+    total = response.json()["total"]
+
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords?offset={total + 10}",
+        timeout=10
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == total
+
+
+@pytest.mark.integration
+def test_update_keyword_returns_normalized(test_asset_id):
+    """Test that renaming a keyword returns the trigger-normalized value."""
+    suffix = uuid.uuid4().hex[:8]
+    response = httpx.post(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/keywords",
+        json={"keyword": f"rename_{suffix}", "source": "manual"},
+        timeout=10
+    )
+    assert response.status_code == 201
+    keyword_id = response.json()["id"]
+
+    try:
+        response = httpx.patch(
+            f"{BASE_URL}/api/v1/keywords/{keyword_id}",
+            json={"keyword": f"Ação_{suffix}"},
+            timeout=10
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["keyword"] == f"Ação_{suffix}"
+        assert data["keyword_normalized"] == f"acao_{suffix}"
+
+        # An empty body leaves the keyword as it is
+        response = httpx.patch(
+            f"{BASE_URL}/api/v1/keywords/{keyword_id}",
+            json={},
+            timeout=10
+        )
+        assert response.status_code == 200
+        assert response.json()["keyword_normalized"] == f"acao_{suffix}"
+    finally:
+        httpx.delete(f"{BASE_URL}/api/v1/keywords/{keyword_id}", timeout=10)
@@ -193,3 +193,120 @@ def test_filter_markers_by_type(test_asset_id):
     # All returned markers should be chapters
     for marker in data["items"]:
         assert marker["marker_type"] == "chapter"
+
+
+@pytest.fixture
+def temp_marker_id(test_asset_id):
+    """Create a marker for a test and delete it afterwards (if still present)."""
+    response = httpx.post(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/markers",
+        json={"marker_type": "comment", "name": "Temp Marker", "start_ms": 1000},
+        timeout=10
+    )
+    assert response.status_code == 201
+    marker_id = response.json()["id"]
+    yield marker_id
+    httpx.delete(f"{BASE_URL}/api/v1/markers/{marker_id}", timeout=10)
+
+
+@pytest.mark.integration
+def test_update_marker_returns_updated_row(temp_marker_id):
+    """Test that PATCH returns the row as written."""
+    response = httpx.patch(
+        f"{BASE_URL}/api/v1/markers/{temp_marker_id}",
+        json={"name": "Renamed Marker", "start_ms": 1500},
+        timeout=10
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["id"] == temp_marker_id
+    assert data["name"] == "Renamed Marker"
+    assert data["start_ms"] == 1500
+    # Fields not in the body are unchanged
+    assert data["marker_type"] == "comment"
+
+    response = httpx.get(f"{BASE_URL}/api/v1/markers/{temp_marker_id}", timeout=10)
+    assert response.json()["name"] == "Renamed Marker"
+
+
+@pytest.mark.integration
+def test_update_marker_empty_body(temp_marker_id):
+    """Test that an empty PATCH leaves the marker unchanged."""
+    response = httpx.patch(
+        f"{BASE_URL}/api/v1/markers/{temp_marker_id}",
+        json={},
+        timeout=10
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["id"] == temp_marker_id
+    assert data["name"] == "Temp Marker"
+    assert data["start_ms"] == 1000
+
+
+@pytest.mark.integration
+def test_update_marker_not_found():
+    """Test 404 when updating a non-existent marker."""
+    response = httpx.patch(
+        f"{BASE_URL}/api/v1/markers/00000000-0000-0000-0000-000000000000",
+        json={"note": "Nobody home"},
+        timeout=10
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_delete_marker(temp_marker_id):
+    """Test deleting a marker, then 404 on a second delete."""
+    response = httpx.delete(f"{BASE_URL}/api/v1/markers/{temp_marker_id}", timeout=10)
+    assert response.status_code == 200
+    assert response.json()["id"] == temp_marker_id
+
+    response = httpx.get(f"{BASE_URL}/api/v1/markers/{temp_marker_id}", timeout=10)
+    assert response.status_code == 404
+
+    response = httpx.delete(f"{BASE_URL}/api/v1/markers/{temp_marker_id}", timeout=10)
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_list_asset_markers_total_matches_across_pages(test_asset_id):
+    """Test that every page reports the full total, not the page size."""
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/markers?limit=500",
+        timeout=10
+    )
+    assert response.status_code == 200
+    total = response.json()["total"]
+    assert total == len(response.json()["items"])
+
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/assets/{test_asset_id}/markers?limit=1",
+        timeout=10
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == total
+    assert len(response.json()["items"]) == min(total, 1)
+
+
+@pytest.mark.integration
+def test_list_asset_markers_past_last_page(test_asset_id):
+    """Test that paging past the end returns no items but still the (filtered) total."""
+    for query in ("", "marker_type=chapter&"):
+        response = httpx.get(
+            f"{BASE_URL}/api/v1/assets/{test_asset_id}/markers?{query}",
+            timeout=10
+        )
+        total = response.json()["total"]
+
+        response = httpx.get(
+            f"{BASE_URL}/api/v1/assets/{test_asset_id}/markers?{query}offset={total + 10}",
+            timeout=10
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == total
@@ -0,0 +1,160 @@
+"""
+AKASHI MAM - Persons API Tests
+Integration tests using httpx (synchronous).
+"""
+
+import pytest
+import httpx
+import uuid
+
+
+BASE_URL = "http://localhost:8000"
+
+
+@pytest.fixture
+def auth_headers():
+    """Get auth headers for a freshly registered test user."""
+    unique_email = f"person_test_{uuid.uuid4().hex[:8]}@akashi.io"
+    httpx.post(
+        f"{BASE_URL}/api/v1/auth/register",
+        json={"email": unique_email, "password": "testpassword123"},
+        timeout=10
+    )
+
+    response = httpx.post(
+        f"{BASE_URL}/api/v1/auth/login",
+        json={"email": unique_email, "password": "testpassword123"},
+        timeout=10
+    )
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    pytest.skip("Could not get auth token")
+
+
+@pytest.fixture
+def person_prefix(auth_headers):
+    """Create five persons sharing a unique name prefix; delete them afterwards."""
+    prefix = f"keyset_{uuid.uuid4().hex[:8]}"
+    person_ids = []
+    # Two share a name so the id tiebreaker is exercised
+    for suffix in ("c", "a", "b", "b", "d"):
+        response = httpx.post(
+            f"{BASE_URL}/api/v1/persons",
+            json={"name": f"{prefix}_{suffix}"},
+            headers=auth_headers,
+            timeout=10
+        )
+        assert response.status_code == 201
+        person_ids.append(response.json()["id"])
+
+    yield prefix
+
+    for person_id in person_ids:
+        httpx.delete(
+            f"{BASE_URL}/api/v1/persons/{person_id}",
+            headers=auth_headers,
+            timeout=10
+        )
+
+
+@pytest.mark.integration
+def test_list_persons_keyset_pagination(auth_headers, person_prefix):
+    """Test that after_name/after_id pages cover every person exactly once, in order."""
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/persons",
+        params={"search": person_prefix, "limit": 50},
+        headers=auth_headers,
+        timeout=10
+    )
+    assert response.status_code == 200
+    expected = [(p["name"], p["id"]) for p in response.json()]
+    assert len(expected) == 5
+    assert [name for name, _ in expected] == sorted(name for name, _ in expected)
+
+    seen = []
+    params = {"search": person_prefix, "limit": 2}
+    while True:
+        response = httpx.get(
+            f"{BASE_URL}/api/v1/persons",
+            params=params,
+            headers=auth_headers,
+            timeout=10
+        )
+        assert response.status_code == 200
+        page = response.json()
+        if not page:
+            break
+        assert len(page) <= 2
+        seen.extend((p["name"], p["id"]) for p in page)
+        params = {**params, "after_name": page[-1]["name"], "after_id": page[-1]["id"]}
+
+    assert seen == expected
+
+
+@pytest.mark.integration
+def test_list_persons_keyset_ignores_skip(auth_headers, person_prefix):
+    """Test that skip is ignored once a keyset cursor is given."""
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/persons",
+        params={"search": person_prefix, "limit": 1},
+        headers=auth_headers,
+        timeout=10
+    )
+    first = response.json()[0]
+
+    cursor = {"after_name": first["name"], "after_id": first["id"]}
+    with_skip = httpx.get(
+        f"{BASE_URL}/api/v1/persons",
+        params={"search": person_prefix, "limit": 50, "skip": 3, **cursor},
+        headers=auth_headers,
+        timeout=10
+    )
+    without_skip = httpx.get(
+        f"{BASE_URL}/api/v1/persons",
+        params={"search": person_prefix, "limit": 50, **cursor},
+        headers=auth_headers,
+        timeout=10
+    )
+    assert with_skip.status_code == 200
+    assert with_skip.json() == without_skip.json()
+    assert len(with_skip.json()) == 4
+
+
+@pytest.mark.integration
+def test_list_persons_next_cursor(auth_headers, person_prefix):
+    """Test that following X-Next-Cursor pages through every person exactly once."""
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/persons",
+        params={"search": person_prefix, "limit": 50},
+        headers=auth_headers,
+        timeout=10
+    )
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+    expected = [p["id"] for p in response.json()]
+
+    seen = []
+    url = f"{BASE_URL}/api/v1/persons?search={person_prefix}&limit=2"
+    while True:
+        response = httpx.get(url, headers=auth_headers, timeout=10)
+        assert response.status_code == 200
+        seen.extend(p["id"] for p in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        url = f"{BASE_URL}/api/v1/persons?search={person_prefix}&limit=2&{cursor}"
+
+    assert seen == expected
+
+
+@pytest.mark.integration
+def test_list_persons_partial_cursor_rejected(auth_headers):
+    """Test that after_name without after_id (and vice versa) is rejected."""
+    for params in ({"after_name": "a"}, {"after_id": str(uuid.uuid4())}):
+        response = httpx.get(
+            f"{BASE_URL}/api/v1/persons",
+            params=params,
+            headers=auth_headers,
+            timeout=10
+        )
+        assert response.status_code == 422
@@ -129,3 +129,56 @@ def test_search_returns_metadata():
     assert "search_time_ms" in data
     assert isinstance(data["search_time_ms"], int)
     assert data["search_time_ms"] >= 0
+
+
+@pytest.mark.integration
+def test_search_past_last_page():
+    """Test that a page past the end returns no results but still the total."""
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/search?q=test&page_size=100",
+        timeout=10
+    )
+    assert response.status_code == 200
+    total = response.json()["total"]
+
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/search?q=test&page_size=100&page={total // 100 + 2}",
+        timeout=10
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["results"] == []
+    assert data["total"] == total
+
+
+@pytest.mark.integration
+def test_search_total_matches_across_pages():
+    """Test that the total is the full match count, not the page size."""
+    first = httpx.get(f"{BASE_URL}/api/v1/search?q=test&page_size=1", timeout=10)
+    second = httpx.get(f"{BASE_URL}/api/v1/search?q=test&page_size=100", timeout=10)
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.json()["total"] == second.json()["total"]
+    assert len(first.json()["results"]) == min(first.json()["total"], 1)
+
+
+@pytest.mark.integration
+def test_advanced_search_past_last_page():
+    """Test that advanced search past the end returns no results but still the total."""
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/search/advanced?asset_type=video&page_size=100",
+        timeout=10
+    )
+    assert response.status_code == 200
+    total = response.json()["total"]
+
+    response = httpx.get(
+        f"{BASE_URL}/api/v1/search/advanced?asset_type=video&page_size=100&page={total // 100 + 2}",
+        timeout=10
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["results"] == []
+    assert data["total"] == total